@@ -0,0 +1,34 @@
+"""add_year_price_index_to_cars_table
+
+Revision ID: 5c1e9b7d3a42
+Revises: a8d7f2f9f521
+Create Date: 2026-10-16 10:12:31.482913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e9b7d3a42"
+down_revision: Union[str, Sequence[str], None] = "a8d7f2f9f521"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Composite index for combined year + price range filters
+    op.create_index(
+        "idx_cars_year_price",
+        "cars",
+        ["year", "price"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_cars_year_price", table_name="cars")
@@ -12,6 +12,7 @@ class InMemoryCarCatalogRepository(CarCatalogRepository):
     - Applies AND-semantics filtering
     - Applies paging AFTER filtering
     - Returns total_count of matching cars before paging
+    - With count_mode="none", stops scanning once the page is full (total_count is None)
     """
 
     def __init__(self, cars: list[Car]) -> None:
@@ -19,6 +20,9 @@ class InMemoryCarCatalogRepository(CarCatalogRepository):
 
     def search(self, filters: CatalogFilters, paging: Paging) -> SearchResult:
         # Trust that UseCase has validated inputs (contract programming)
+        if paging.count_mode == "none":
+            return SearchResult(cars=self._scan_page(filters, paging), total_count=None)
+
         matches = [car for car in self._cars if self._matches(car, filters)]
         total_count = len(matches)  # Count BEFORE paging
 
@@ -28,6 +32,17 @@ class InMemoryCarCatalogRepository(CarCatalogRepository):
 
         return SearchResult(cars=paginated_cars, total_count=total_count)
 
+    def _scan_page(self, filters: CatalogFilters, paging: Paging) -> list[Car]:
+        """Collect matches up to offset + limit, then stop scanning."""
+        end = paging.offset + paging.limit
+        matches: list[Car] = []
+        for car in self._cars:
+            if self._matches(car, filters):
+                matches.append(car)
+                if len(matches) == end:
+                    break
+        return matches[paging.offset :]
+
     def get_by_id(self, car_id: str) -> Car | None:
         """
         Get car by ID.
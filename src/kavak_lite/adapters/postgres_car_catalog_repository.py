@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from decimal import Decimal
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -13,7 +15,7 @@ from kavak_lite.infra.db.models.car import CarRow
 from kavak_lite.ports.car_catalog_repository import CarCatalogRepository, SearchResult
 
 if TYPE_CHECKING:
-    from sqlalchemy.sql import Select
+    from sqlalchemy.sql import ColumnElement, Select
 
 
 class PostgresCarCatalogRepository(CarCatalogRepository):
@@ -26,6 +28,9 @@ class PostgresCarCatalogRepository(CarCatalogRepository):
     - Converts CarRow (infrastructure) to Car (domain)
     """
 
+    # Built once per request by the HTTP dependencies, so keep instances dict-free.
+    __slots__ = ("_session",)
+
     def __init__(self, session: Session) -> None:
         """
         Initialize repository with database session.
@@ -43,12 +48,15 @@ class PostgresCarCatalogRepository(CarCatalogRepository):
         1. COUNT(*) to get total matching cars (before paging)
         2. SELECT with OFFSET/LIMIT to get paginated results
 
+        With paging.count_mode == "none" the COUNT(*) query is skipped
+        and total_count is None.
+
         Args:
             filters: Filter criteria (AND semantics) - must be pre-validated
             paging: Pagination parameters - must be pre-validated
 
         Returns:
-            SearchResult with cars and total_count
+            SearchResult with cars and total_count (None if not counted)
 
         Note:
             Assumes inputs are validated by UseCase (contract programming).
@@ -58,9 +66,11 @@ class PostgresCarCatalogRepository(CarCatalogRepository):
         # Build base query with filters
         query = self._build_query(filters)
 
-        # Execute COUNT query for total_count (before paging)
-        count_query = select(func.count()).select_from(query.subquery())
-        total_count = self._session.execute(count_query).scalar() or 0
+        # Execute COUNT query for total_count (before paging), unless caller opted out
+        total_count: int | None = None
+        if paging.count_mode == "exact":
+            count_query = select(func.count()).select_from(query.subquery())
+            total_count = self._session.execute(count_query).scalar() or 0
 
         # Apply paging to get results
         query = query.offset(paging.offset).limit(paging.limit)
@@ -92,57 +102,100 @@ class PostgresCarCatalogRepository(CarCatalogRepository):
         """
         Build SQLAlchemy query with filters applied.
 
+        Conditions are collected first and applied with a single .where() call,
+        avoiding one statement clone per filter.
+
         Args:
             filters: Filter criteria to apply
 
         Returns:
             SQLAlchemy select statement with WHERE clauses
         """
-        query = select(CarRow)
+        conditions: list[ColumnElement[bool]] = []
 
-        # Case-insensitive exact match for make
+        # Case-insensitive exact match for make/model. Both sides use Postgres
+        # LOWER() (Python's str.lower() can differ for non-ASCII input); the
+        # column side matches the LOWER(make)/LOWER(model) functional indexes.
         if filters.make:
-            query = query.where(func.lower(CarRow.make) == func.lower(filters.make))
-
-        # Case-insensitive exact match for model
+            conditions.append(func.lower(CarRow.make) == func.lower(filters.make))
         if filters.model:
-            query = query.where(func.lower(CarRow.model) == func.lower(filters.model))
+            conditions.append(func.lower(CarRow.model) == func.lower(filters.model))
 
         # Year range filters (inclusive)
         if filters.year_min is not None:
-            query = query.where(CarRow.year >= filters.year_min)
+            conditions.append(CarRow.year >= filters.year_min)
         if filters.year_max is not None:
-            query = query.where(CarRow.year <= filters.year_max)
+            conditions.append(CarRow.year <= filters.year_max)
 
         # Price range filters (inclusive)
         if filters.price_min is not None:
-            query = query.where(CarRow.price >= filters.price_min)
+            conditions.append(CarRow.price >= filters.price_min)
         if filters.price_max is not None:
-            query = query.where(CarRow.price <= filters.price_max)
+            conditions.append(CarRow.price <= filters.price_max)
 
-        return query
+        return select(CarRow).where(*conditions)
 
     def _to_domain(self, row: CarRow) -> Car:
         """
         Convert database model (CarRow) to domain entity (Car).
 
+        Identical rows (e.g. repeated across pages) map to the same interned
+        Car instance; Car is frozen, so sharing it is safe.
+
         Args:
             row: SQLAlchemy CarRow model
 
         Returns:
             Car domain entity
         """
+        return self._car_from_fields(
+            str(row.id),  # Convert UUID to string
+            row.make,
+            row.model,
+            row.year,
+            str(row.price),  # Exact Decimal string, so the cache keeps its scale
+            row.trim,
+            row.mileage_km,
+            row.transmission,
+            row.fuel_type,
+            row.body_type,
+            row.location,
+            row.url,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _car_from_fields(
+        id: str,
+        make: str,
+        model: str,
+        year: int,
+        price: str,
+        trim: str | None,
+        mileage_km: int | None,
+        transmission: str | None,
+        fuel_type: str | None,
+        body_type: str | None,
+        location: str | None,
+        url: str | None,
+    ) -> Car:
+        """Build (and intern) a Car from column values.
+
+        The price is keyed as its exact string: Decimal equality ignores the
+        exponent (Decimal("1.0") == Decimal("1.00")), so a value-keyed cache could
+        hand back a price in another representation if the column scale changed.
+        """
         return Car(
-            id=str(row.id),  # Convert UUID to string
-            make=row.make,
-            model=row.model,
-            year=row.year,
-            price=row.price,  # Already Decimal from NUMERIC column
-            trim=row.trim,
-            mileage_km=row.mileage_km,
-            transmission=row.transmission,
-            fuel_type=row.fuel_type,
-            body_type=row.body_type,
-            location=row.location,
-            url=row.url,
+            id=id,
+            make=make,
+            model=model,
+            year=year,
+            price=Decimal(price),
+            trim=trim,
+            mileage_km=mileage_km,
+            transmission=transmission,
+            fuel_type=fuel_type,
+            body_type=body_type,
+            location=location,
+            url=url,
         )
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import Literal
 
 from kavak_lite.domain.errors import ValidationError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Car:
     id: str
     make: str
@@ -78,10 +79,11 @@ class CatalogFilters:
                 }
             )
 
-        # Cross-field validation: price range
+        # Cross-field validation: price range (only between Decimals; a wrong-typed
+        # bound is reported above and may not even be comparable)
         if (
-            self.price_min is not None
-            and self.price_max is not None
+            isinstance(self.price_min, Decimal)
+            and isinstance(self.price_max, Decimal)
             and self.price_min > self.price_max
         ):
             errors.append(
@@ -103,10 +105,24 @@ class CatalogFilters:
             raise ValidationError(errors=errors)
 
 
+MAX_PAGE_LIMIT = 200
+
+CountMode = Literal["exact", "none"]
+COUNT_MODES: frozenset[str] = frozenset({"exact", "none"})
+
+
 @dataclass(frozen=True, slots=True)
 class Paging:
+    """Pagination parameters.
+
+    Bounds (including limit <= MAX_PAGE_LIMIT) are checked once by validate() in
+    the UseCase; repository adapters trust a validated Paging and never re-check.
+    """
+
     offset: int = 0
     limit: int = 20
+    # "exact": compute total_count before paging; "none": skip counting (total_count is None)
+    count_mode: CountMode = "exact"
 
     def validate(self) -> None:
         """Validate paging parameters.
@@ -134,11 +150,20 @@ class Paging:
                 }
             )
 
-        if self.limit > 200:
+        if self.limit > MAX_PAGE_LIMIT:
             errors.append(
                 {
                     "field": "limit",
-                    "message": "Must be less than or equal to 200",
+                    "message": f"Must be less than or equal to {MAX_PAGE_LIMIT}",
+                    "code": "INVALID_VALUE",
+                }
+            )
+
+        if self.count_mode not in COUNT_MODES:
+            errors.append(
+                {
+                    "field": "count_mode",
+                    "message": f"Must be one of {sorted(COUNT_MODES)}",
                     "code": "INVALID_VALUE",
                 }
             )
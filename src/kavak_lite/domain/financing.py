@@ -6,7 +6,8 @@ from decimal import Decimal
 from kavak_lite.domain.errors import ValidationError
 
 
-ALLOWED_TERMS = {36, 48, 60, 72}
+ALLOWED_TERMS = frozenset({36, 48, 60, 72})
+_ALLOWED_TERMS_MESSAGE = f"Must be one of {{{', '.join(map(str, sorted(ALLOWED_TERMS)))}}}"
 ANNUAL_INTEREST_RATE = Decimal("0.10")
 
 
@@ -52,7 +53,7 @@ class FinancingRequest:
             errors.append(
                 {
                     "field": "term_months",
-                    "message": f"Must be one of {ALLOWED_TERMS}",
+                    "message": _ALLOWED_TERMS_MESSAGE,
                     "code": "INVALID_VALUE",
                 }
             )
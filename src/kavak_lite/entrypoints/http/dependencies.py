@@ -7,6 +7,7 @@ Only stateless singletons should use lru_cache.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Generator
 
 from fastapi import Depends
@@ -81,12 +82,13 @@ def get_get_car_by_id_use_case(db: Session = Depends(get_db)) -> GetCarById:
     return GetCarById(car_catalog_repository=repository)
 
 
+@lru_cache
 def get_calculate_financing_plan_use_case() -> CalculateFinancingPlan:
     """
     Factory function that returns a configured CalculateFinancingPlan use case.
 
-    This function is called per-request. Since CalculateFinancingPlan is stateless
-    and has no dependencies, we can return a new instance each time.
+    CalculateFinancingPlan is a frozen dataclass with no dependencies, so it is
+    stateless and thread-safe: one shared instance serves every request.
 
     Returns:
         CalculateFinancingPlan: Configured use case instance
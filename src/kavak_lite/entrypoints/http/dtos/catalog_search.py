@@ -1,5 +1,7 @@
 from pydantic import BaseModel, ConfigDict, Field
 
+from kavak_lite.domain.car import MAX_PAGE_LIMIT
+
 
 class CarResponseDTO(BaseModel):
     id: str
@@ -23,6 +25,8 @@ class CarResponseDTO(BaseModel):
     )
     url: str | None = Field(None, description="URL to car details page")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CarsSearchQueryDTO(BaseModel):
     """Query parameters for searching cars in the catalog."""
@@ -72,7 +76,7 @@ class CarsSearchQueryDTO(BaseModel):
         description="Maximum number of results to return",
         examples=[20],
         ge=1,
-        le=200,
+        le=MAX_PAGE_LIMIT,
     )
 
     model_config = ConfigDict(
@@ -96,3 +100,5 @@ class CatalogSearchResponseDTO(BaseModel):
     total: int
     offset: int
     limit: int
+
+    model_config = ConfigDict(frozen=True)
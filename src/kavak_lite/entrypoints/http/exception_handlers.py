@@ -3,10 +3,13 @@
 Translates domain errors to appropriate HTTP responses with structured error format.
 """
 
+import json
 import logging
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 from typing import Any
 
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
@@ -14,8 +17,53 @@ from kavak_lite.domain.errors import DomainError
 
 logger = logging.getLogger(__name__)
 
+# Map domain error codes to HTTP status codes; unknown codes fall back to 400
+_STATUS_CODE_BY_ERROR_CODE: dict[str, int] = {
+    "VALIDATION_ERROR": 422,  # HTTP_422_UNPROCESSABLE_CONTENT
+    "NOT_FOUND": status.HTTP_404_NOT_FOUND,
+    "CONFLICT": status.HTTP_409_CONFLICT,
+    "UNAUTHORIZED": status.HTTP_401_UNAUTHORIZED,
+    "FORBIDDEN": status.HTTP_403_FORBIDDEN,
+    "INTERNAL_ERROR": status.HTTP_500_INTERNAL_SERVER_ERROR,
+}
 
-async def handle_domain_error(request: Request, exc: DomainError) -> JSONResponse:
+# Request parts FastAPI prepends to validation error locations
+_LOCATION_PREFIXES = frozenset({"body", "query", "path", "header", "cookie"})
+
+
+def _field_path(loc: Sequence[int | str]) -> str:
+    """Dotted field path for an error location, minus its request-part prefix."""
+    if loc and loc[0] in _LOCATION_PREFIXES:
+        loc = loc[1:]
+    return ".".join(str(part) for part in loc)
+
+
+@lru_cache(maxsize=512)
+def _render_error(detail: str, code: str) -> bytes:
+    """Serialize a `{detail, code}` error body exactly as JSONResponse would.
+
+    Most error bodies repeat (same code, same message), so the encoded bytes are
+    memoized. The cache is bounded so a stream of distinct messages cannot grow it.
+    """
+    return json.dumps(
+        {"detail": detail, "code": code}, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+# The catch-all body never varies, so it is rendered once at import
+_UNEXPECTED_ERROR_BODY = _render_error("An unexpected error occurred", "INTERNAL_ERROR")
+
+
+def _error_response(status_code: int, detail: str, code: str) -> Response:
+    """Build a JSON error response without field-level errors."""
+    return Response(
+        content=_render_error(detail, code),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+async def handle_domain_error(request: Request, exc: DomainError) -> Response:
     """Handle all domain errors with automatic HTTP status code mapping.
 
     Maps domain errors to appropriate HTTP status codes:
@@ -36,48 +84,41 @@ async def handle_domain_error(request: Request, exc: DomainError) -> JSONRespons
     """
     error_dict = exc.to_dict()
 
-    # Map error codes to HTTP status codes
-    status_code_map: dict[str, int] = {
-        "VALIDATION_ERROR": 422,  # HTTP_422_UNPROCESSABLE_CONTENT
-        "NOT_FOUND": status.HTTP_404_NOT_FOUND,
-        "CONFLICT": status.HTTP_409_CONFLICT,
-        "UNAUTHORIZED": status.HTTP_401_UNAUTHORIZED,
-        "FORBIDDEN": status.HTTP_403_FORBIDDEN,
-        "INTERNAL_ERROR": status.HTTP_500_INTERNAL_SERVER_ERROR,
-    }
-
-    status_code = status_code_map.get(exc.error_code, status.HTTP_400_BAD_REQUEST)
+    status_code = _STATUS_CODE_BY_ERROR_CODE.get(exc.error_code, status.HTTP_400_BAD_REQUEST)
 
-    # Log errors (except expected validation errors)
+    # Log errors; client errors are frequent, so skip building their extras
+    # when INFO is disabled
     if status_code >= 500:
         logger.error(
             "Domain error occurred",
             extra={
                 "error_code": exc.error_code,
-                "message": exc.message,
+                "error_message": exc.message,
                 "context": exc.context,
                 "path": request.url.path,
                 "method": request.method,
             },
         )
-    elif status_code >= 400:
+    elif status_code >= 400 and logger.isEnabledFor(logging.INFO):
         logger.info(
             "Client error",
             extra={
                 "error_code": exc.error_code,
-                "message": exc.message,
+                "error_message": exc.message,
                 "path": request.url.path,
                 "method": request.method,
             },
         )
 
     # Build structured response
-    response_content: dict[str, Any] = {
-        "detail": error_dict.get("message", str(exc)),
-        "code": error_dict.get("code", exc.error_code),
-    }
+    detail = error_dict.get("message", str(exc))
+    code = error_dict.get("code", exc.error_code)
+
+    # Plain errors reuse cached bodies; field-level errors (ValidationError) vary
+    if "errors" not in error_dict and isinstance(detail, str) and isinstance(code, str):
+        return _error_response(status_code, detail, code)
 
-    # Add field-level errors if present (for ValidationError)
+    response_content: dict[str, Any] = {"detail": detail, "code": code}
     if "errors" in error_dict:
         response_content["errors"] = error_dict["errors"]
 
@@ -103,30 +144,25 @@ async def handle_request_validation_error(
     Returns:
         JSON response with 422 status and structured errors
     """
-    errors = []
-
-    for error in exc.errors():
-        # Extract field path from error location
-        # Filter out 'body' and 'query' prefixes
-        field_path = ".".join(str(loc) for loc in error["loc"] if loc not in ("body", "query"))
-
-        errors.append(
-            {
-                "field": field_path,
-                "message": error["msg"],
-                "code": error["type"],
-            }
+    errors = [
+        {
+            "field": _field_path(error["loc"]),
+            "message": error["msg"],
+            "code": error["type"],
+        }
+        for error in exc.errors()
+    ]
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Request validation error",
+            extra={
+                "errors": errors,
+                "path": request.url.path,
+                "method": request.method,
+            },
         )
 
-    logger.info(
-        "Request validation error",
-        extra={
-            "errors": errors,
-            "path": request.url.path,
-            "method": request.method,
-        },
-    )
-
     return JSONResponse(
         status_code=422,  # HTTP_422_UNPROCESSABLE_CONTENT
         content={
@@ -137,7 +173,7 @@ async def handle_request_validation_error(
     )
 
 
-async def handle_value_error(request: Request, exc: ValueError) -> JSONResponse:
+async def handle_value_error(request: Request, exc: ValueError) -> Response:
     """Handle ValueError from domain logic or mappers.
 
     Often raised during type conversions (e.g., Decimal parsing).
@@ -149,25 +185,24 @@ async def handle_value_error(request: Request, exc: ValueError) -> JSONResponse:
     Returns:
         JSON response with 422 status
     """
-    logger.info(
-        "Value error",
-        extra={
-            "message": str(exc),
-            "path": request.url.path,
-            "method": request.method,
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Value error",
+            extra={
+                "error_message": str(exc),
+                "path": request.url.path,
+                "method": request.method,
+            },
+        )
 
-    return JSONResponse(
-        status_code=422,  # HTTP_422_UNPROCESSABLE_CONTENT
-        content={
-            "detail": str(exc),
-            "code": "INVALID_VALUE",
-        },
+    return _error_response(
+        422,  # HTTP_422_UNPROCESSABLE_CONTENT
+        str(exc),
+        "INVALID_VALUE",
     )
 
 
-async def handle_unexpected_error(request: Request, exc: Exception) -> JSONResponse:
+async def handle_unexpected_error(request: Request, exc: Exception) -> Response:
     """Catch-all handler for unexpected errors.
 
     These should be rare and indicate bugs or infrastructure issues.
@@ -185,32 +220,39 @@ async def handle_unexpected_error(request: Request, exc: Exception) -> JSONRespo
         exc_info=exc,
         extra={
             "error_type": type(exc).__name__,
-            "message": str(exc),
+            "error_message": str(exc),
             "path": request.url.path,
             "method": request.method,
         },
     )
 
-    return JSONResponse(
+    return Response(
+        content=_UNEXPECTED_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "detail": "An unexpected error occurred",
-            "code": "INTERNAL_ERROR",
-        },
+        media_type="application/json",
     )
 
 
+# Exception type → handler, in registration order. Starlette resolves handlers
+# by walking the raised exception's MRO, so the Exception catch-all stays last.
+_EXCEPTION_HANDLERS: tuple[tuple[type[Exception], Callable[..., Any]], ...] = (
+    (DomainError, handle_domain_error),
+    (RequestValidationError, handle_request_validation_error),
+    (ValueError, handle_value_error),
+    (Exception, handle_unexpected_error),
+)
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers with FastAPI app.
 
-    This should be called once during app initialization.
+    This should be called once during app initialization. Calling it again on
+    the same app is harmless: each exception type maps to a single handler.
 
     Args:
         app: FastAPI application instance
     """
-    app.add_exception_handler(DomainError, handle_domain_error)  # type: ignore[arg-type]
-    app.add_exception_handler(RequestValidationError, handle_request_validation_error)  # type: ignore[arg-type]
-    app.add_exception_handler(ValueError, handle_value_error)  # type: ignore[arg-type]
-    app.add_exception_handler(Exception, handle_unexpected_error)
+    for exc_class, handler in _EXCEPTION_HANDLERS:
+        app.add_exception_handler(exc_class, handler)
 
     logger.info("Exception handlers registered successfully")
@@ -0,0 +1,60 @@
+"""Cached Decimal conversions shared by the HTTP mappers.
+
+Both CatalogSearchMapper and FinancingMapper import from here, so a price seen
+in a catalog search is already parsed when it shows up in a financing request.
+
+Monetary strings repeat heavily across requests (list prices, common filter
+bounds), so parsing is memoized. Decimal is immutable, which makes sharing
+cached instances safe. Money formatting lives here as well so the boundary
+shape of amounts is defined in one place.
+"""
+
+from __future__ import annotations
+
+from decimal import MAX_PREC, Context, Decimal
+from functools import lru_cache
+from typing import cast
+
+_CENTS = Decimal("0.01")
+# Padding only appends zeros, so it must never round or trap on precision; a
+# fixed context also keeps the caller's thread-local settings out of it.
+_PAD_CONTEXT = Context(prec=MAX_PREC)
+
+
+@lru_cache(maxsize=2048)
+def decimal_from_str(value: str) -> Decimal:
+    """
+    Parse a decimal string, reusing the Decimal for repeated inputs.
+
+    Args:
+        value: Decimal string (e.g., "25000.00")
+
+    Returns:
+        Decimal with the exact value (and exponent) of the string
+
+    Raises:
+        InvalidOperation: If the string is not a valid decimal (not cached)
+    """
+    return Decimal(value)
+
+
+def money_to_str(value: Decimal) -> str:
+    """
+    Format a monetary Decimal with at least two decimal places.
+
+    Whole or one-place amounts are padded (Decimal("40000") → "40000.00") so
+    money has a predictable shape. Extra precision is kept as-is: rounding is
+    the use case's policy, not the mapper's.
+
+    Args:
+        value: Monetary amount
+
+    Returns:
+        String with at least two decimal places (NaN/Infinity as str() gives them)
+    """
+    if not value.is_finite():
+        return str(value)
+    # Finite Decimals always have an int exponent ('n'/'N'/'F' are non-finite only)
+    if cast(int, value.as_tuple().exponent) > -2:
+        value = value.quantize(_CENTS, context=_PAD_CONTEXT)  # exact: only appends zeros
+    return str(value)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from decimal import Decimal
+from functools import lru_cache
 
 from kavak_lite.domain.car import Car, CatalogFilters, Paging
 from kavak_lite.entrypoints.http.dtos.catalog_search import (
@@ -8,12 +8,51 @@ from kavak_lite.entrypoints.http.dtos.catalog_search import (
     CarsSearchQueryDTO,
     CatalogSearchResponseDTO,
 )
+from kavak_lite.entrypoints.http.mappers._decimal import decimal_from_str, money_to_str
 from kavak_lite.use_cases.search_car_catalog import (
     SearchCarCatalogRequest,
     SearchCarCatalogResponse,
 )
 
 
+@lru_cache(maxsize=256)
+def _filters_from_query(
+    brand: str | None,
+    model: str | None,
+    year_min: int | None,
+    year_max: int | None,
+    price_min: str | None,
+    price_max: str | None,
+) -> CatalogFilters:
+    """
+    Build (and memoize) domain filters from raw filter query values.
+
+    Keyed on the filter fields only, so paging through the same search
+    (different offset/limit) reuses one frozen CatalogFilters instance.
+    """
+    return CatalogFilters(
+        make=brand,  # DTO uses 'brand', domain uses 'make'
+        model=model,
+        year_min=year_min,
+        year_max=year_max,
+        price_min=decimal_from_str(price_min) if price_min else None,
+        price_max=decimal_from_str(price_max) if price_max else None,
+    )
+
+
+# "Browse all" searches (no filters) share one pre-built instance
+_NO_FILTER_VALUES: tuple[None, ...] = (None,) * 6
+_EMPTY_FILTERS = CatalogFilters()
+
+
+def _filters_from_dto(dto: CarsSearchQueryDTO) -> CatalogFilters:
+    """Map the DTO's filter fields, short-circuiting the unfiltered case."""
+    values = (dto.brand, dto.model, dto.year_min, dto.year_max, dto.price_min, dto.price_max)
+    if values == _NO_FILTER_VALUES:
+        return _EMPTY_FILTERS
+    return _filters_from_query(*values)
+
+
 class CatalogSearchMapper:
     """Maps between REST DTOs and domain models for catalog search."""
 
@@ -28,14 +67,7 @@ class CatalogSearchMapper:
         Returns:
             CatalogFilters: Domain filters with Decimal prices
         """
-        return CatalogFilters(
-            make=dto.brand,  # DTO uses 'brand', domain uses 'make'
-            model=dto.model,
-            year_min=dto.year_min,
-            year_max=dto.year_max,
-            price_min=Decimal(dto.price_min) if dto.price_min else None,
-            price_max=Decimal(dto.price_max) if dto.price_max else None,
-        )
+        return _filters_from_dto(dto)
 
     @staticmethod
     def to_domain_paging(dto: CarsSearchQueryDTO) -> Paging:
@@ -53,7 +85,10 @@ class CatalogSearchMapper:
     @staticmethod
     def to_domain_request(dto: CarsSearchQueryDTO) -> SearchCarCatalogRequest:
         """
-        Convenience method: builds complete domain request from DTO.
+        Builds complete domain request from DTO in a single pass.
+
+        Equivalent to combining to_domain_filters() and to_domain_paging(), but
+        without the intermediate calls (request hot path).
 
         Args:
             dto: The data transfer object containing search query parameters
@@ -62,8 +97,8 @@ class CatalogSearchMapper:
             SearchCarCatalogRequest: Complete domain request with filters and paging
         """
         return SearchCarCatalogRequest(
-            filters=CatalogSearchMapper.to_domain_filters(dto),
-            paging=CatalogSearchMapper.to_domain_paging(dto),
+            filters=_filters_from_dto(dto),
+            paging=Paging(offset=dto.offset, limit=dto.limit),
         )
 
     @staticmethod
@@ -71,7 +106,8 @@ class CatalogSearchMapper:
         """
         Converts domain Car entity to REST response DTO.
 
-        Handles Decimal → str conversion at the boundary.
+        Handles Decimal → str conversion at the boundary. Uses model_construct()
+        to skip Pydantic validation: the values come from a trusted domain entity.
 
         Args:
             car: Domain Car entity
@@ -79,12 +115,12 @@ class CatalogSearchMapper:
         Returns:
             CarResponseDTO: REST response DTO with string price
         """
-        return CarResponseDTO(
+        return CarResponseDTO.model_construct(
             id=car.id,
             brand=car.make,  # Domain uses 'make', DTO uses 'brand'
             model=car.model,
             year=car.year,
-            price=str(car.price),  # Decimal → str at boundary
+            price=money_to_str(car.price),  # Decimal → str at boundary
             trim=car.trim,
             mileage_km=car.mileage_km,
             transmission=car.transmission,
@@ -103,6 +139,9 @@ class CatalogSearchMapper:
         """
         Converts domain search result to REST response with pagination metadata.
 
+        Uses model_construct(): the cars are already-built DTOs and the paging
+        values were validated on the way in.
+
         Args:
             result: Domain search result containing cars and total count
             offset: Current offset (echoed from request)
@@ -111,9 +150,17 @@ class CatalogSearchMapper:
         Returns:
             CatalogSearchResponseDTO: REST response with cars and pagination metadata
         """
-        return CatalogSearchResponseDTO(
-            cars=[CatalogSearchMapper.to_car_response(car) for car in result.cars],
+        return CatalogSearchResponseDTO.model_construct(
+            cars=list(map(CatalogSearchMapper.to_car_response, result.cars)),
             total=result.total_count or 0,  # Handle None from repository
             offset=offset,
             limit=limit,
         )
+
+
+# Module-level aliases for hot paths (skip the class attribute lookup per call)
+to_domain_filters = CatalogSearchMapper.to_domain_filters
+to_domain_paging = CatalogSearchMapper.to_domain_paging
+to_domain_request = CatalogSearchMapper.to_domain_request
+to_car_response = CatalogSearchMapper.to_car_response
+to_response = CatalogSearchMapper.to_response
@@ -8,6 +8,10 @@ from kavak_lite.entrypoints.http.dtos.financing import (
     FinancingRequestDTO,
     FinancingResponseDTO,
 )
+from kavak_lite.entrypoints.http.mappers._decimal import (
+    decimal_from_str,
+    money_to_str,
+)
 
 
 class FinancingMapper:
@@ -33,7 +37,7 @@ class FinancingMapper:
 
         # Convert price
         try:
-            price = Decimal(dto.price)
+            price = decimal_from_str(dto.price)
         except (InvalidOperation, ValueError):
             errors.append(
                 {
@@ -46,7 +50,7 @@ class FinancingMapper:
 
         # Convert down_payment
         try:
-            down_payment = Decimal(dto.down_payment)
+            down_payment = decimal_from_str(dto.down_payment)
         except (InvalidOperation, ValueError):
             errors.append(
                 {
@@ -71,7 +75,8 @@ class FinancingMapper:
         """
         Converts domain FinancingPlan to response DTO.
 
-        Handles Decimal → string conversion at the boundary.
+        Handles Decimal → string conversion at the boundary. Uses model_construct()
+        to skip Pydantic validation: the values come from a computed domain plan.
 
         Args:
             plan: Domain financing plan with Decimal values
@@ -79,11 +84,16 @@ class FinancingMapper:
         Returns:
             Response DTO with string monetary values
         """
-        return FinancingResponseDTO(
-            principal=str(plan.principal),
+        return FinancingResponseDTO.model_construct(
+            principal=money_to_str(plan.principal),
             annual_rate=str(plan.annual_rate),
             term_months=plan.term_months,
-            monthly_payment=str(plan.monthly_payment),
-            total_paid=str(plan.total_paid),
-            total_interest=str(plan.total_interest),
+            monthly_payment=money_to_str(plan.monthly_payment),
+            total_paid=money_to_str(plan.total_paid),
+            total_interest=money_to_str(plan.total_interest),
         )
+
+
+# Module-level aliases for hot paths (skip the class attribute lookup per call)
+to_domain_request = FinancingMapper.to_domain_request
+to_response = FinancingMapper.to_response
@@ -0,0 +1,18 @@
+"""JSON responses for route handlers.
+
+Response DTOs are built by the mappers from validated domain objects, so
+routes serialize them directly with Pydantic's JSON serializer instead of
+letting FastAPI re-validate them and run them through `jsonable_encoder`.
+"""
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def json_response(dto: BaseModel) -> Response:
+    """Serialize a response DTO to a JSON response in a single pass.
+
+    Routes using this set `response_model=None` and list the DTO under
+    `responses[200]["model"]` so the OpenAPI schema is unchanged.
+    """
+    return Response(content=dto.model_dump_json(), media_type="application/json")
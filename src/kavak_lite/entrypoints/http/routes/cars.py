@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 from kavak_lite.entrypoints.http.dtos.catalog_search import (
     CarResponseDTO,
     CarsSearchQueryDTO,
     CatalogSearchResponseDTO,
 )
-from kavak_lite.entrypoints.http.mappers.catalog_search_mapper import CatalogSearchMapper
+from kavak_lite.entrypoints.http.mappers.catalog_search_mapper import (
+    to_car_response,
+    to_domain_request,
+    to_response,
+)
+from kavak_lite.entrypoints.http.responses import json_response
 from kavak_lite.entrypoints.http.dependencies import (
     get_get_car_by_id_use_case,
     get_search_catalog_use_case,
@@ -19,7 +24,7 @@ router = APIRouter(tags=["Cars"])
 
 @router.get(
     "/cars",
-    response_model=CatalogSearchResponseDTO,
+    response_model=None,
     summary="Search car catalog",
     description="""
     Search for cars in the catalog with optional filters and pagination.
@@ -41,6 +46,7 @@ router = APIRouter(tags=["Cars"])
     """,
     responses={
         200: {
+            "model": CatalogSearchResponseDTO,
             "description": "Successful response",
             "content": {
                 "application/json": {
@@ -72,25 +78,27 @@ router = APIRouter(tags=["Cars"])
 def get_cars(
     query: CarsSearchQueryDTO = Depends(),
     use_case: SearchCarCatalog = Depends(get_search_catalog_use_case),
-) -> CatalogSearchResponseDTO:
+) -> Response:
     """Search cars endpoint following parse → execute → map → return pattern."""
     # 1. Map to domain request
-    request = CatalogSearchMapper.to_domain_request(query)
+    request = to_domain_request(query)
 
     # 2. Execute use case
     result = use_case.execute(request)
 
     # 3. Map to response
-    return CatalogSearchMapper.to_response(
-        result=result,
-        offset=query.offset,
-        limit=query.limit,
+    return json_response(
+        to_response(
+            result=result,
+            offset=query.offset,
+            limit=query.limit,
+        )
     )
 
 
 @router.get(
     "/cars/{car_id}",
-    response_model=CarResponseDTO,
+    response_model=None,
     summary="Get car by ID",
     description="""
     Retrieve detailed information about a specific car by its ID.
@@ -105,6 +113,7 @@ def get_cars(
     """,
     responses={
         200: {
+            "model": CarResponseDTO,
             "description": "Car found",
             "content": {
                 "application/json": {
@@ -159,7 +168,7 @@ def get_cars(
 def get_car_by_id(
     car_id: str,
     use_case: GetCarById = Depends(get_get_car_by_id_use_case),
-) -> CarResponseDTO:
+) -> Response:
     """Get car by ID following parse → execute → map → return pattern."""
     # 1. Parse
     request = GetCarByIdRequest(car_id=car_id)
@@ -168,4 +177,4 @@ def get_car_by_id(
     result = use_case.execute(request)
 
     # 3. Map to response
-    return CatalogSearchMapper.to_car_response(result.car)
+    return json_response(to_car_response(result.car))
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 from kavak_lite.entrypoints.http.dependencies import get_calculate_financing_plan_use_case
 from kavak_lite.entrypoints.http.dtos.financing import (
     FinancingRequestDTO,
     FinancingResponseDTO,
 )
-from kavak_lite.entrypoints.http.mappers.financing_mapper import FinancingMapper
+from kavak_lite.entrypoints.http.mappers.financing_mapper import (
+    to_domain_request,
+    to_response,
+)
+from kavak_lite.entrypoints.http.responses import json_response
 from kavak_lite.use_cases.calculate_financing_plan import CalculateFinancingPlan
 
 
@@ -14,7 +18,7 @@ router = APIRouter(tags=["Financing"])
 
 @router.post(
     "/financing/plan",
-    response_model=FinancingResponseDTO,
+    response_model=None,
     summary="Calculate financing plan",
     description="""
     Calculate a financing plan for a car purchase.
@@ -46,6 +50,7 @@ router = APIRouter(tags=["Financing"])
     """,
     responses={
         200: {
+            "model": FinancingResponseDTO,
             "description": "Successful calculation",
             "content": {
                 "application/json": {
@@ -116,7 +121,7 @@ router = APIRouter(tags=["Financing"])
 def calculate_financing_plan(
     payload: FinancingRequestDTO,
     use_case: CalculateFinancingPlan = Depends(get_calculate_financing_plan_use_case),
-) -> FinancingResponseDTO:
+) -> Response:
     """
     Calculate financing plan endpoint.
 
@@ -125,13 +130,13 @@ def calculate_financing_plan(
     2. Map: Convert DTO to domain request
     3. Execute: Call use case (which validates domain rules)
     4. Map: Convert domain result to response DTO
-    5. Return: FastAPI serializes response
+    5. Return: Serialize the DTO to JSON
     """
     # 1. Map to domain request (string → Decimal)
-    request = FinancingMapper.to_domain_request(payload)
+    request = to_domain_request(payload)
 
     # 2. Execute use case (validates and calculates)
     plan = use_case.execute(request)
 
     # 3. Map to response (Decimal → string)
-    return FinancingMapper.to_response(plan)
+    return json_response(to_response(plan))
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from kavak_lite.domain.car import Car, CatalogFilters, Paging
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """Result from catalog search including pagination metadata."""
 
@@ -27,6 +27,8 @@ class CarCatalogRepository(ABC):
         - Implementations trust inputs are valid and do not re-validate
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def search(self, filters: CatalogFilters, paging: Paging) -> SearchResult:
         """
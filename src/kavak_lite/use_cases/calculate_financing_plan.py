@@ -1,14 +1,85 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Context, Decimal, ROUND_HALF_EVEN, ROUND_HALF_UP
+from functools import lru_cache
 
 from kavak_lite.domain.financing import (
+    ALLOWED_TERMS,
     ANNUAL_INTEREST_RATE,
     FinancingPlan,
     FinancingRequest,
 )
 
+_ONE = Decimal("1")
+_MONTHS_PER_YEAR = Decimal("12")
+_CENTS = Decimal("0.01")
+# Fixed arithmetic context (the decimal defaults) so plans don't depend on, or
+# pay a lookup of, whatever thread-local context the caller happens to have set;
+# memoized plans must not differ by which thread computed them first.
+_CONTEXT = Context(prec=28, rounding=ROUND_HALF_EVEN)
+_SORTED_TERMS = tuple(sorted(ALLOWED_TERMS))
+
+
+@lru_cache(maxsize=64)
+def _annuity_terms(monthly_rate: str, term_months: int) -> tuple[Decimal, Decimal]:
+    """Return (r*(1+r)^n, (1+r)^n - 1) for the amortized payment formula.
+
+    Only a few (rate, term) pairs ever occur, so the Decimal power is computed
+    once per pair rather than on every request. Keyed on the exact rate string,
+    like _financing_plan, since Decimal equality ignores the exponent.
+    """
+    rate = Decimal(monthly_rate)
+    factor = _CONTEXT.power(_CONTEXT.add(_ONE, rate), term_months)
+    return _CONTEXT.multiply(rate, factor), _CONTEXT.subtract(factor, _ONE)
+
+
+@lru_cache(maxsize=4096)
+def _financing_plan(annual_rate: str, principal: str, term_months: int) -> FinancingPlan:
+    """Compute the plan for one (rate, principal, term) quote, memoized.
+
+    Popular prices are quoted over and over, and FinancingPlan is immutable, so
+    repeated quotes share one plan. Keyed on the exact Decimal strings rather
+    than the Decimals: Decimal equality ignores the exponent
+    (Decimal("1.0") == Decimal("1.00")) and the plan echoes the principal and rate
+    back, so a value-keyed cache could return another representation than a
+    fresh computation.
+    """
+    rate = Decimal(annual_rate)
+    loan = Decimal(principal)
+    term = Decimal(term_months)
+
+    # Standard amortized loan payment:
+    # monthly_payment = P * (r*(1+r)^n) / ((1+r)^n - 1)
+    if rate == 0:
+        # Interest-free: no monthly rate or power to compute
+        monthly_payment_precise = _CONTEXT.divide(loan, term)
+    else:
+        monthly_rate = _CONTEXT.divide(rate, _MONTHS_PER_YEAR)
+        numerator, denominator = _annuity_terms(str(monthly_rate), term_months)
+        monthly_payment_precise = _CONTEXT.divide(_CONTEXT.multiply(loan, numerator), denominator)
+
+    # Explicit rounding: monthly payment to 2 decimal places (cents)
+    monthly_payment = monthly_payment_precise.quantize(
+        _CENTS, rounding=ROUND_HALF_UP, context=_CONTEXT
+    )
+
+    if monthly_payment <= 0:
+        raise ValueError("Computed monthly payment is invalid")
+
+    # Compute totals from rounded monthly payment
+    total_paid = _CONTEXT.multiply(monthly_payment, term)
+    total_interest = _CONTEXT.subtract(total_paid, loan)
+
+    return FinancingPlan(
+        principal=loan,
+        annual_rate=rate,
+        term_months=term_months,
+        monthly_payment=monthly_payment,
+        total_paid=total_paid,
+        total_interest=total_interest,
+    )
+
 
 @dataclass(frozen=True, slots=True)
 class CalculateFinancingPlan:
@@ -27,34 +98,20 @@ class CalculateFinancingPlan:
     def execute(self, req: FinancingRequest) -> FinancingPlan:
         req.validate()
 
-        principal = req.price - req.down_payment
-        monthly_rate = self.annual_rate / Decimal("12")
-        term_months = Decimal(req.term_months)
-
-        # Standard amortized loan payment:
-        # monthly_payment = P * (r*(1+r)^n) / ((1+r)^n - 1)
-        if monthly_rate == 0:
-            monthly_payment_precise = principal / term_months
-        else:
-            one = Decimal("1")
-            factor = (one + monthly_rate) ** term_months
-            monthly_payment_precise = principal * (monthly_rate * factor) / (factor - one)
-
-        # Explicit rounding: monthly payment to 2 decimal places (cents)
-        monthly_payment = monthly_payment_precise.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-        if monthly_payment <= 0:
-            raise ValueError("Computed monthly payment is invalid")
-
-        # Compute totals from rounded monthly payment
-        total_paid = monthly_payment * term_months
-        total_interest = total_paid - principal
-
-        return FinancingPlan(
-            principal=principal,
-            annual_rate=self.annual_rate,
-            term_months=int(term_months),
-            monthly_payment=monthly_payment,
-            total_paid=total_paid,
-            total_interest=total_interest,
-        )
+        principal = _CONTEXT.subtract(req.price, req.down_payment)
+        return _financing_plan(str(self.annual_rate), str(principal), req.term_months)
+
+    def execute_all_terms(self, price: Decimal, down_payment: Decimal) -> dict[int, FinancingPlan]:
+        """Calculate the plan for every allowed term, keyed by term in months.
+
+        Validates the price and down payment once and shares the rate and
+        principal across all terms; each plan equals the one execute() returns
+        for that term.
+        """
+        FinancingRequest(
+            price=price, down_payment=down_payment, term_months=_SORTED_TERMS[0]
+        ).validate()
+
+        annual_rate = str(self.annual_rate)
+        principal = str(_CONTEXT.subtract(price, down_payment))
+        return {term: _financing_plan(annual_rate, principal, term) for term in _SORTED_TERMS}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from uuid import UUID
 
@@ -9,6 +10,23 @@ from kavak_lite.domain.car import Car
 from kavak_lite.domain.errors import NotFoundError, ValidationError
 from kavak_lite.ports.car_catalog_repository import CarCatalogRepository
 
+# Canonical (hyphenated) and bare-hex UUIDs, i.e. nearly every real request.
+# A match is accepted without building a UUID; anything else falls back to
+# uuid.UUID, which also takes braced/urn forms (as the Postgres adapter does).
+_UUID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}\Z"
+)
+
+
+def _is_valid_uuid(value: str) -> bool:
+    if _UUID_RE.match(value):
+        return True
+    try:
+        UUID(value)
+    except ValueError:
+        return False
+    return True
+
 
 @dataclass(frozen=True, slots=True)
 class GetCarByIdRequest:
@@ -34,6 +52,8 @@ class GetCarById:
     - Raise NotFoundError if car doesn't exist
     """
 
+    __slots__ = ("_repository",)
+
     def __init__(self, car_catalog_repository: CarCatalogRepository) -> None:
         """
         Initialize use case with dependencies.
@@ -58,9 +78,7 @@ class GetCarById:
             NotFoundError: If car with given ID doesn't exist
         """
         # Validate UUID format
-        try:
-            UUID(request.car_id)
-        except ValueError:
+        if not _is_valid_uuid(request.car_id):
             raise ValidationError(
                 errors=[
                     {
@@ -32,6 +32,8 @@ class SearchCarCatalog:
     See: docs/adr/12-25-25-car-catalog-search.md
     """
 
+    __slots__ = ("_repository",)
+
     def __init__(self, car_catalog_repository: CarCatalogRepository) -> None:
         self._repository = car_catalog_repository
 
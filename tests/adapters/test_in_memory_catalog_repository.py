@@ -10,6 +10,7 @@ Test sections:
 - Decimal Precision: Tests for exact Decimal arithmetic (no float approximation)
 - Empty Repository: Tests for edge case of empty data set
 - Metadata - total_count: Tests for total_count behavior with filters and paging
+- count_mode="none": Tests for paging without total_count
 - get_by_id: Tests for retrieving individual cars by ID
 """
 
@@ -23,7 +24,7 @@ from kavak_lite.domain.car import Car, CatalogFilters, Paging
 from kavak_lite.ports.car_catalog_repository import SearchResult
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def cars() -> list[Car]:
     return [
         Car(id="1", make="Toyota", model="Corolla", year=2018, price=Decimal("250000.00")),
@@ -148,52 +149,25 @@ def test_search_paging_applies_after_filtering(cars: list[Car]) -> None:
     assert [car.id for car in result.cars] == ["2"]
 
 
-def test_search_year_min_only(cars: list[Car]) -> None:
-    """Only minimum year bound (no maximum) - tests single-sided range."""
+@pytest.mark.parametrize(
+    ("filters", "expected_ids"),
+    [
+        (CatalogFilters(year_min=2020), ["2", "4", "5"]),  # 2020, 2021, 2022
+        (CatalogFilters(year_max=2019), ["1", "3"]),  # 2018, 2019
+        (CatalogFilters(price_min=Decimal("350000.00")), ["2", "4", "5"]),  # 350k, 400k, 420k
+        (CatalogFilters(price_max=Decimal("280000.00")), ["1", "3"]),  # 250k, 280k
+    ],
+    ids=["year_min_only", "year_max_only", "price_min_only", "price_max_only"],
+)
+def test_search_single_sided_range(
+    cars: list[Car], filters: CatalogFilters, expected_ids: list[str]
+) -> None:
+    """Only one bound of a range (no opposite bound) - tests single-sided ranges."""
     repo = InMemoryCarCatalogRepository(cars)
 
-    result = repo.search(
-        filters=CatalogFilters(year_min=2020),
-        paging=Paging(offset=0, limit=50),
-    )
-
-    assert [car.id for car in result.cars] == ["2", "4", "5"]  # 2020, 2021, 2022
-
-
-def test_search_year_max_only(cars: list[Car]) -> None:
-    """Only maximum year bound (no minimum) - tests single-sided range."""
-    repo = InMemoryCarCatalogRepository(cars)
-
-    result = repo.search(
-        filters=CatalogFilters(year_max=2019),
-        paging=Paging(offset=0, limit=50),
-    )
-
-    assert [car.id for car in result.cars] == ["1", "3"]  # 2018, 2019
-
-
-def test_search_price_min_only(cars: list[Car]) -> None:
-    """Only minimum price bound (no maximum) - tests single-sided range."""
-    repo = InMemoryCarCatalogRepository(cars)
-
-    result = repo.search(
-        filters=CatalogFilters(price_min=Decimal("350000.00")),
-        paging=Paging(offset=0, limit=50),
-    )
-
-    assert [car.id for car in result.cars] == ["2", "4", "5"]  # 350k, 400k, 420k
-
-
-def test_search_price_max_only(cars: list[Car]) -> None:
-    """Only maximum price bound (no minimum) - tests single-sided range."""
-    repo = InMemoryCarCatalogRepository(cars)
-
-    result = repo.search(
-        filters=CatalogFilters(price_max=Decimal("280000.00")),
-        paging=Paging(offset=0, limit=50),
-    )
+    result = repo.search(filters=filters, paging=Paging(offset=0, limit=50))
 
-    assert [car.id for car in result.cars] == ["1", "3"]  # 250k, 280k
+    assert [car.id for car in result.cars] == expected_ids
 
 
 def test_search_no_filters_returns_all(cars: list[Car]) -> None:
@@ -245,40 +219,27 @@ def test_search_paging_limit_larger_than_results(cars: list[Car]) -> None:
     assert len(result.cars) == 5
 
 
-def test_search_paging_first_item_only(cars: list[Car]) -> None:
-    """offset=0, limit=1 returns only the first item."""
-    repo = InMemoryCarCatalogRepository(cars)
-
-    result = repo.search(
-        filters=CatalogFilters(),
-        paging=Paging(offset=0, limit=1),
-    )
-
-    assert [car.id for car in result.cars] == ["1"]
-
-
-def test_search_paging_last_item_only(cars: list[Car]) -> None:
-    """offset at last item, limit=1 returns only the last item."""
-    repo = InMemoryCarCatalogRepository(cars)
-
-    result = repo.search(
-        filters=CatalogFilters(),
-        paging=Paging(offset=4, limit=1),
-    )
-
-    assert [car.id for car in result.cars] == ["5"]
-
-
-def test_search_paging_middle_page(cars: list[Car]) -> None:
-    """Paging through middle of results works correctly."""
+@pytest.mark.parametrize(
+    ("offset", "limit", "expected_ids"),
+    [
+        (0, 1, ["1"]),
+        (4, 1, ["5"]),
+        (2, 2, ["3", "4"]),
+    ],
+    ids=["first_item_only", "last_item_only", "middle_page"],
+)
+def test_search_paging_window(
+    cars: list[Car], offset: int, limit: int, expected_ids: list[str]
+) -> None:
+    """offset/limit select the expected window of results."""
     repo = InMemoryCarCatalogRepository(cars)
 
     result = repo.search(
         filters=CatalogFilters(),
-        paging=Paging(offset=2, limit=2),
+        paging=Paging(offset=offset, limit=limit),
     )
 
-    assert [car.id for car in result.cars] == ["3", "4"]
+    assert [car.id for car in result.cars] == expected_ids
 
 
 def test_search_paging_with_filters_combined(cars: list[Car]) -> None:
@@ -461,6 +422,41 @@ def test_search_result_structure(cars: list[Car]) -> None:
     assert result.total_count is not None
 
 
+# ==============================================================================
+# count_mode="none"
+# ==============================================================================
+
+
+def test_search_count_mode_none_returns_no_total_count(cars: list[Car]) -> None:
+    """count_mode="none" skips counting; total_count is None."""
+    repo = InMemoryCarCatalogRepository(cars)
+
+    result = repo.search(
+        filters=CatalogFilters(make="Toyota"),
+        paging=Paging(offset=0, limit=1, count_mode="none"),
+    )
+
+    assert result.total_count is None
+    assert [car.id for car in result.cars] == ["1"]
+
+
+def test_search_count_mode_none_pages_like_exact(cars: list[Car]) -> None:
+    """count_mode="none" returns the same page as count_mode="exact"."""
+    repo = InMemoryCarCatalogRepository(cars)
+
+    for offset, limit in [(0, 2), (1, 2), (2, 2), (4, 1), (100, 10)]:
+        exact = repo.search(
+            filters=CatalogFilters(make="toyota"),
+            paging=Paging(offset=offset, limit=limit),
+        )
+        none = repo.search(
+            filters=CatalogFilters(make="toyota"),
+            paging=Paging(offset=offset, limit=limit, count_mode="none"),
+        )
+
+        assert none.cars == exact.cars
+
+
 # ==============================================================================
 # get_by_id
 # ==============================================================================
@@ -122,6 +122,45 @@ def test_search_applies_filters_to_query(mock_session: Mock) -> None:
     assert mock_session.execute.call_count == 2
 
 
+def test_build_query_without_filters_has_no_where_clause() -> None:
+    """No filters means no WHERE clause at all."""
+    repo = PostgresCarCatalogRepository(Mock())
+
+    query = repo._build_query(CatalogFilters())
+
+    assert query.whereclause is None
+
+
+def test_build_query_combines_all_filters() -> None:
+    """Every provided filter becomes one AND-ed condition."""
+    repo = PostgresCarCatalogRepository(Mock())
+
+    query = repo._build_query(
+        CatalogFilters(
+            make="Toyota",
+            model="Corolla",
+            year_min=2018,
+            year_max=2022,
+            price_min=Decimal("200000.00"),
+            price_max=Decimal("300000.00"),
+        )
+    )
+
+    assert query.whereclause is not None
+    assert len(list(query.whereclause.get_children())) == 6
+
+
+def test_build_query_lowers_both_sides_of_make_and_model() -> None:
+    """make/model compare LOWER(column) to LOWER(parameter), both in Postgres."""
+    repo = PostgresCarCatalogRepository(Mock())
+
+    query = repo._build_query(CatalogFilters(make="ToYoTa", model="COROLLA"))
+    compiled = query.compile()
+
+    assert sorted(compiled.params.values()) == ["COROLLA", "ToYoTa"]  # sent as given
+    assert str(compiled).count("lower(") == 4
+
+
 def test_search_applies_paging(mock_session: Mock) -> None:
     """Repository applies OFFSET and LIMIT to query."""
     count_result = Mock()
@@ -308,6 +347,27 @@ def test_search_handles_null_count_as_zero(mock_session: Mock) -> None:
     assert result.total_count == 0
 
 
+def test_search_skips_count_query_when_count_mode_none(
+    mock_session: Mock, sample_car_rows: list[CarRow]
+) -> None:
+    """count_mode="none" executes only the SELECT query and returns no total_count."""
+    select_result = Mock()
+    select_result.scalars.return_value.all.return_value = sample_car_rows
+
+    mock_session.execute.side_effect = [select_result]
+
+    repo = PostgresCarCatalogRepository(mock_session)
+
+    result = repo.search(
+        filters=CatalogFilters(),
+        paging=Paging(offset=0, limit=20, count_mode="none"),
+    )
+
+    assert mock_session.execute.call_count == 1
+    assert result.total_count is None
+    assert len(result.cars) == 2
+
+
 # ==============================================================================
 # Domain Mapping Tests
 # ==============================================================================
@@ -348,6 +408,32 @@ def test_to_domain_handles_various_uuids() -> None:
     assert uuid.UUID(car.id) == test_uuid
 
 
+def test_to_domain_interns_identical_rows(sample_car_rows: list[CarRow]) -> None:
+    """Identical rows map to the same Car instance; different rows do not."""
+    repo = PostgresCarCatalogRepository(Mock())
+    first, second = sample_car_rows
+
+    assert repo._to_domain(first) is repo._to_domain(first)
+    assert repo._to_domain(first) is not repo._to_domain(second)
+
+
+def test_to_domain_keeps_price_scale_per_row() -> None:
+    """Equal prices with different scales are not served each other's interned Car."""
+    repo = PostgresCarCatalogRepository(Mock())
+    car_id = uuid.uuid4()
+
+    def row_with_price(price: Decimal) -> CarRow:
+        row = CarRow(id=car_id, make="Test", model="Car", year=2020, price=price)
+        row._sa_instance_state = MagicMock()  # type: ignore
+        return row
+
+    coarse = repo._to_domain(row_with_price(Decimal("100000.0")))
+    fine = repo._to_domain(row_with_price(Decimal("100000.00")))
+
+    assert str(coarse.price) == "100000.0"
+    assert str(fine.price) == "100000.00"
+
+
 # ==============================================================================
 # get_by_id Tests
 # ==============================================================================
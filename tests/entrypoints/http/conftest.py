@@ -0,0 +1,26 @@
+"""
+Shared fixtures for HTTP entrypoint tests.
+
+Each test module defines its own module-scoped `app` fixture; the client here
+builds on it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="module")
+def client(app: FastAPI) -> Iterator[TestClient]:
+    """Create a test client for the module's app (shared across the module).
+
+    Entering the client keeps one event-loop portal open for the whole module
+    instead of starting a new one for every request. Server exceptions are
+    returned as responses so the exception handlers' output can be asserted.
+    """
+    with TestClient(app, raise_server_exceptions=False) as test_client:
+        yield test_client
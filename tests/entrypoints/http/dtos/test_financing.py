@@ -0,0 +1,51 @@
+"""
+Test suite for the financing request/response DTOs.
+
+Request-body validation is checked on the model directly; the route tests keep
+one end-to-end 422 case to cover the wiring.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pydantic import ValidationError as PydanticValidationError
+
+from kavak_lite.entrypoints.http.dtos.financing import FinancingRequestDTO
+
+VALID_PAYLOAD = {"price": "25000.00", "down_payment": "5000.00", "term_months": 60}
+
+
+def test_request_dto_accepts_valid_payload() -> None:
+    """A well-formed payload keeps monetary values as strings."""
+    dto = FinancingRequestDTO.model_validate(VALID_PAYLOAD)
+
+    assert dto.price == "25000.00"
+    assert dto.down_payment == "5000.00"
+    assert dto.term_months == 60
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        pytest.param({"price": "abc"}, id="invalid_price_format"),
+        pytest.param({"price": "25000.123"}, id="price_with_too_many_decimals"),
+        pytest.param({"term_months": -1}, id="negative_term_months"),
+        pytest.param({"price": "$25,000.00"}, id="price_with_special_characters"),
+        pytest.param({"price": ""}, id="empty_string_for_price"),
+    ],
+)
+def test_request_dto_rejects_invalid_fields(overrides: dict[str, Any]) -> None:
+    """Malformed monetary strings and out-of-range terms fail validation."""
+    with pytest.raises(PydanticValidationError):
+        FinancingRequestDTO.model_validate(VALID_PAYLOAD | overrides)
+
+
+def test_request_dto_rejects_missing_required_fields() -> None:
+    """down_payment and term_months are required."""
+    with pytest.raises(PydanticValidationError) as exc_info:
+        FinancingRequestDTO.model_validate({"price": "25000.00"})
+
+    missing = {error["loc"][0] for error in exc_info.value.errors()}
+    assert missing == {"down_payment", "term_months"}
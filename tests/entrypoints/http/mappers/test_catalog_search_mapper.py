@@ -15,6 +15,10 @@ See: docs/ADR/12-26-25-rest-endpoint-design-pattern.md
 from __future__ import annotations
 
 from decimal import Decimal
+from operator import attrgetter
+
+import pytest
+from pydantic import ValidationError as PydanticValidationError
 
 from kavak_lite.domain.car import Car, CatalogFilters, Paging
 from kavak_lite.entrypoints.http.dtos.catalog_search import (
@@ -22,6 +26,7 @@ from kavak_lite.entrypoints.http.dtos.catalog_search import (
     CarsSearchQueryDTO,
     CatalogSearchResponseDTO,
 )
+from kavak_lite.entrypoints.http.mappers import catalog_search_mapper
 from kavak_lite.entrypoints.http.mappers.catalog_search_mapper import CatalogSearchMapper
 from kavak_lite.use_cases.search_car_catalog import (
     SearchCarCatalogRequest,
@@ -34,127 +39,80 @@ from kavak_lite.use_cases.search_car_catalog import (
 # ==============================================================================
 
 
-def test_to_domain_filters_with_all_fields() -> None:
-    """Mapper converts all filter fields from DTO to domain."""
-    dto = CarsSearchQueryDTO(
-        brand="Toyota",
-        model="Camry",
-        year_min=2018,
-        year_max=2023,
-        price_min="20000.00",
-        price_max="35000.00",
-        offset=0,
-        limit=20,
-    )
-
+_filter_fields = attrgetter("make", "model", "year_min", "year_max", "price_min", "price_max")
+
+
+@pytest.mark.parametrize(
+    ("dto", "expected"),
+    [
+        (
+            CarsSearchQueryDTO(
+                brand="Toyota",
+                model="Camry",
+                year_min=2018,
+                year_max=2023,
+                price_min="20000.00",
+                price_max="35000.00",
+            ),
+            ("Toyota", "Camry", 2018, 2023, Decimal("20000.00"), Decimal("35000.00")),
+        ),
+        (CarsSearchQueryDTO(), (None, None, None, None, None, None)),
+        # DTO 'brand' → domain 'make'
+        (CarsSearchQueryDTO(brand="Honda"), ("Honda", None, None, None, None, None)),
+        # Price strings → Decimal at the boundary
+        (
+            CarsSearchQueryDTO(price_min="15000.50", price_max="45000.99"),
+            (None, None, None, None, Decimal("15000.50"), Decimal("45000.99")),
+        ),
+        (
+            CarsSearchQueryDTO(price_min=None, price_max=None),
+            (None, None, None, None, None, None),
+        ),
+        (
+            CarsSearchQueryDTO(year_min=2015, year_max=2020),
+            (None, None, 2015, 2020, None, None),
+        ),
+        (
+            CarsSearchQueryDTO(brand="Ford", year_min=2019),
+            ("Ford", None, 2019, None, None, None),
+        ),
+    ],
+    ids=[
+        "all_fields",
+        "no_filters",
+        "brand_to_make",
+        "price_strings_to_decimal",
+        "none_prices",
+        "year_values",
+        "partial_filters",
+    ],
+)
+def test_to_domain_filters(dto: CarsSearchQueryDTO, expected: tuple[object, ...]) -> None:
+    """Mapper converts filter fields from DTO to domain."""
     result = CatalogSearchMapper.to_domain_filters(dto)
 
     assert isinstance(result, CatalogFilters)
-    assert result.make == "Toyota"  # DTO 'brand' → domain 'make'
-    assert result.model == "Camry"
-    assert result.year_min == 2018
-    assert result.year_max == 2023
-    assert result.price_min == Decimal("20000.00")  # str → Decimal
-    assert result.price_max == Decimal("35000.00")  # str → Decimal
-
+    assert _filter_fields(result) == expected
+    for price in (result.price_min, result.price_max):
+        assert price is None or isinstance(price, Decimal)
 
-def test_to_domain_filters_with_no_filters() -> None:
-    """Mapper handles empty filters (all None)."""
-    dto = CarsSearchQueryDTO(
-        offset=0,
-        limit=20,
-    )
 
-    result = CatalogSearchMapper.to_domain_filters(dto)
+def test_to_domain_filters_shares_instance_when_unfiltered() -> None:
+    """Searches without filters all map to the same empty CatalogFilters."""
+    result = CatalogSearchMapper.to_domain_filters(CarsSearchQueryDTO())
 
-    assert isinstance(result, CatalogFilters)
-    assert result.make is None
-    assert result.model is None
-    assert result.year_min is None
-    assert result.year_max is None
-    assert result.price_min is None
-    assert result.price_max is None
+    assert result == CatalogFilters()
+    assert result is CatalogSearchMapper.to_domain_filters(CarsSearchQueryDTO(offset=40))
 
 
-def test_to_domain_filters_converts_brand_to_make() -> None:
-    """Mapper translates DTO 'brand' to domain 'make'."""
-    dto = CarsSearchQueryDTO(
-        brand="Honda",
-        offset=0,
-        limit=20,
-    )
-
-    result = CatalogSearchMapper.to_domain_filters(dto)
+def test_to_domain_filters_reuses_filters_across_pages() -> None:
+    """The same filter set on different pages maps to one cached CatalogFilters."""
+    first_page = CarsSearchQueryDTO(brand="Toyota", price_max="35000.00", offset=0, limit=20)
+    second_page = CarsSearchQueryDTO(brand="Toyota", price_max="35000.00", offset=20, limit=20)
 
-    assert result.make == "Honda"
-
-
-def test_to_domain_filters_converts_price_strings_to_decimal() -> None:
-    """Mapper converts price strings to Decimal at the boundary."""
-    dto = CarsSearchQueryDTO(
-        price_min="15000.50",
-        price_max="45000.99",
-        offset=0,
-        limit=20,
-    )
-
-    result = CatalogSearchMapper.to_domain_filters(dto)
-
-    # Verify Decimal conversion
-    assert isinstance(result.price_min, Decimal)
-    assert isinstance(result.price_max, Decimal)
-    assert result.price_min == Decimal("15000.50")
-    assert result.price_max == Decimal("45000.99")
-
-
-def test_to_domain_filters_handles_none_prices() -> None:
-    """Mapper handles None prices without conversion."""
-    dto = CarsSearchQueryDTO(
-        price_min=None,
-        price_max=None,
-        offset=0,
-        limit=20,
-    )
-
-    result = CatalogSearchMapper.to_domain_filters(dto)
-
-    assert result.price_min is None
-    assert result.price_max is None
-
-
-def test_to_domain_filters_preserves_year_values() -> None:
-    """Mapper passes year values through unchanged."""
-    dto = CarsSearchQueryDTO(
-        year_min=2015,
-        year_max=2020,
-        offset=0,
-        limit=20,
-    )
-
-    result = CatalogSearchMapper.to_domain_filters(dto)
-
-    assert result.year_min == 2015
-    assert result.year_max == 2020
-
-
-def test_to_domain_filters_handles_partial_filters() -> None:
-    """Mapper works with only some filters populated."""
-    dto = CarsSearchQueryDTO(
-        brand="Ford",
-        year_min=2019,
-        # model, year_max, prices not set
-        offset=0,
-        limit=20,
-    )
-
-    result = CatalogSearchMapper.to_domain_filters(dto)
-
-    assert result.make == "Ford"
-    assert result.year_min == 2019
-    assert result.model is None
-    assert result.year_max is None
-    assert result.price_min is None
-    assert result.price_max is None
+    assert CatalogSearchMapper.to_domain_filters(
+        first_page
+    ) is CatalogSearchMapper.to_domain_filters(second_page)
 
 
 # ==============================================================================
@@ -162,55 +120,22 @@ def test_to_domain_filters_handles_partial_filters() -> None:
 # ==============================================================================
 
 
-def test_to_domain_paging_with_default_values() -> None:
-    """Mapper converts default pagination values."""
-    dto = CarsSearchQueryDTO(
-        offset=0,
-        limit=20,
-    )
-
-    result = CatalogSearchMapper.to_domain_paging(dto)
-
-    assert isinstance(result, Paging)
-    assert result.offset == 0
-    assert result.limit == 20
-
-
-def test_to_domain_paging_with_custom_values() -> None:
-    """Mapper converts custom pagination values."""
-    dto = CarsSearchQueryDTO(
-        offset=100,
-        limit=50,
-    )
-
-    result = CatalogSearchMapper.to_domain_paging(dto)
-
-    assert result.offset == 100
-    assert result.limit == 50
-
-
-def test_to_domain_paging_with_max_limit() -> None:
-    """Mapper handles maximum allowed limit."""
-    dto = CarsSearchQueryDTO(
-        offset=0,
-        limit=200,
-    )
-
-    result = CatalogSearchMapper.to_domain_paging(dto)
-
-    assert result.limit == 200
+_paging_fields = attrgetter("offset", "limit")
 
 
-def test_to_domain_paging_with_min_limit() -> None:
-    """Mapper handles minimum allowed limit."""
-    dto = CarsSearchQueryDTO(
-        offset=0,
-        limit=1,
-    )
+@pytest.mark.parametrize(
+    ("offset", "limit"),
+    [(0, 20), (100, 50), (0, 200), (0, 1)],
+    ids=["default_values", "custom_values", "max_limit", "min_limit"],
+)
+def test_to_domain_paging(offset: int, limit: int) -> None:
+    """Mapper converts pagination values unchanged."""
+    dto = CarsSearchQueryDTO(offset=offset, limit=limit)
 
     result = CatalogSearchMapper.to_domain_paging(dto)
 
-    assert result.limit == 1
+    assert isinstance(result, Paging)
+    assert _paging_fields(result) == (offset, limit)
 
 
 # ==============================================================================
@@ -267,6 +192,30 @@ def test_to_domain_request_with_minimal_data() -> None:
     assert result.paging.limit == 20
 
 
+def test_to_domain_request_matches_separate_filters_and_paging() -> None:
+    """Fused to_domain_request equals to_domain_filters + to_domain_paging."""
+    dtos = [
+        CarsSearchQueryDTO(),
+        CarsSearchQueryDTO(brand="Mazda", price_max="199999.99", offset=40, limit=10),
+        CarsSearchQueryDTO(
+            brand="Toyota",
+            model="Corolla",
+            year_min=2018,
+            year_max=2023,
+            price_min="20000.00",
+            price_max="35000.00",
+            offset=10,
+            limit=50,
+        ),
+    ]
+
+    for dto in dtos:
+        result = CatalogSearchMapper.to_domain_request(dto)
+
+        assert result.filters == CatalogSearchMapper.to_domain_filters(dto)
+        assert result.paging == CatalogSearchMapper.to_domain_paging(dto)
+
+
 # ==============================================================================
 # to_car_response() - Domain Car → Response DTO
 # ==============================================================================
@@ -340,20 +289,18 @@ def test_to_car_response_preserves_decimal_precision() -> None:
 
 
 def test_to_car_response_handles_whole_numbers() -> None:
-    """Mapper handles whole number prices correctly."""
+    """Mapper formats whole number prices with two decimal places."""
     car = Car(
         id="1",
         make="Chevrolet",
         model="Silverado",
         year=2021,
-        price=Decimal("40000.00"),
+        price=Decimal("40000"),
     )
 
     result = CatalogSearchMapper.to_car_response(car)
 
-    # String representation may vary, but should be parseable back to Decimal
-    assert result.price in ["40000.00", "40000"]
-    assert Decimal(result.price) == Decimal("40000.00")
+    assert result.price == "40000.00"
 
 
 def test_to_car_response_maps_all_fields_with_extended_car() -> None:
@@ -418,6 +365,16 @@ def test_to_car_response_handles_optional_fields_none() -> None:
     assert result.url is None
 
 
+def test_to_car_response_returns_immutable_dto() -> None:
+    """Response DTOs are frozen; mapped values cannot be altered afterwards."""
+    car = Car(id="1", make="Honda", model="Civic", year=2021, price=Decimal("30000.00"))
+
+    result = CatalogSearchMapper.to_car_response(car)
+
+    with pytest.raises(PydanticValidationError):
+        result.price = "0.00"  # type: ignore[misc]
+
+
 # ==============================================================================
 # to_response() - Domain Result → Response DTO with Pagination
 # ==============================================================================
@@ -489,6 +446,27 @@ def test_to_response_handles_empty_results() -> None:
     assert result.limit == 20
 
 
+def test_to_response_empty_results_do_not_share_cars_list() -> None:
+    """Each no-match response gets its own cars list (mutating one leaks nowhere)."""
+    empty = SearchCarCatalogResponse(cars=[], total_count=0)
+
+    first = CatalogSearchMapper.to_response(empty, offset=0, limit=20)
+    first.cars.append(CarResponseDTO.model_construct(id="leak"))
+    second = CatalogSearchMapper.to_response(empty, offset=0, limit=20)
+
+    assert second.cars == []
+
+
+def test_to_response_reports_total_for_empty_page_past_end() -> None:
+    """An empty page past the end still reports the real total_count."""
+    result = SearchCarCatalogResponse(cars=[], total_count=5)
+
+    response = CatalogSearchMapper.to_response(result, offset=100, limit=20)
+
+    assert response.cars == []
+    assert response.total == 5
+
+
 def test_to_response_handles_none_total_count() -> None:
     """Mapper handles None total_count (repository may not calculate it)."""
     cars = [
@@ -644,3 +622,22 @@ def test_decimal_roundtrip_conversion() -> None:
     # Verify roundtrip preservation
     assert response_dto.price == "12345.67"
     assert Decimal(response_dto.price) == Decimal("12345.67")
+
+
+def test_module_level_aliases_map_like_static_methods() -> None:
+    """The module-level aliases the routes use produce the same results as the methods."""
+    dto = CarsSearchQueryDTO(brand="Toyota", price_max="35000.00", offset=20, limit=10)
+    car = Car(id="1", make="Toyota", model="Corolla", year=2020, price=Decimal("25000.00"))
+    result = SearchCarCatalogResponse(cars=[car], total_count=21)
+
+    assert catalog_search_mapper.to_domain_filters(dto) == CatalogSearchMapper.to_domain_filters(
+        dto
+    )
+    assert catalog_search_mapper.to_domain_paging(dto) == CatalogSearchMapper.to_domain_paging(dto)
+    assert catalog_search_mapper.to_domain_request(dto) == CatalogSearchMapper.to_domain_request(
+        dto
+    )
+    assert catalog_search_mapper.to_car_response(car) == CatalogSearchMapper.to_car_response(car)
+    assert catalog_search_mapper.to_response(
+        result, offset=20, limit=10
+    ) == CatalogSearchMapper.to_response(result, offset=20, limit=10)
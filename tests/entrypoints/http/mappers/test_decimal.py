@@ -0,0 +1,64 @@
+"""
+Test suite for the cached Decimal conversions used by the HTTP mappers.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal, InvalidOperation, localcontext
+
+import pytest
+
+from kavak_lite.entrypoints.http.mappers._decimal import (
+    decimal_from_str,
+    money_to_str,
+)
+
+
+def test_decimal_from_str_parses_exact_value() -> None:
+    """Parsing preserves value and exponent (no float round-trip)."""
+    result = decimal_from_str("25000.10")
+
+    assert result == Decimal("25000.10")
+    assert str(result) == "25000.10"
+
+
+def test_decimal_from_str_reuses_instance_for_repeated_input() -> None:
+    """Repeated strings return the cached Decimal instance."""
+    assert decimal_from_str("35000.00") is decimal_from_str("35000.00")
+
+
+def test_decimal_from_str_distinguishes_exponents() -> None:
+    """Equal values with different exponents are cached separately."""
+    assert str(decimal_from_str("100")) == "100"
+    assert str(decimal_from_str("100.00")) == "100.00"
+
+
+def test_decimal_from_str_raises_for_invalid_input() -> None:
+    """Invalid strings raise InvalidOperation (and are not cached)."""
+    with pytest.raises(InvalidOperation):
+        decimal_from_str("abc")
+
+
+def test_money_to_str_pads_to_two_decimal_places() -> None:
+    """Whole and one-place amounts gain trailing zeros."""
+    assert money_to_str(Decimal("40000")) == "40000.00"
+    assert money_to_str(Decimal("40000.5")) == "40000.50"
+    assert money_to_str(Decimal("40000.50")) == "40000.50"
+
+
+def test_money_to_str_keeps_extra_precision() -> None:
+    """Amounts with more than two places are not rounded."""
+    assert money_to_str(Decimal("424.9400123456")) == "424.9400123456"
+
+
+def test_money_to_str_ignores_low_precision_caller_context() -> None:
+    """Padding does not trap or round under a coarse thread-local context."""
+    with localcontext(prec=6):
+        assert money_to_str(Decimal("250000")) == "250000.00"
+        assert money_to_str(Decimal("1234567.8")) == "1234567.80"
+
+
+@pytest.mark.parametrize("value", ["NaN", "Infinity", "-Infinity"])
+def test_money_to_str_passes_non_finite_values_through(value: str) -> None:
+    """Non-finite Decimals (Postgres NUMERIC can hold NaN) format like str()."""
+    assert money_to_str(Decimal(value)) == str(Decimal(value))
@@ -21,6 +21,7 @@ from kavak_lite.entrypoints.http.dtos.financing import (
     FinancingRequestDTO,
     FinancingResponseDTO,
 )
+from kavak_lite.entrypoints.http.mappers import financing_mapper
 from kavak_lite.entrypoints.http.mappers.financing_mapper import FinancingMapper
 
 
@@ -154,7 +155,7 @@ def test_to_response_preserves_decimal_precision() -> None:
 
 
 def test_to_response_handles_whole_numbers() -> None:
-    """Mapper handles Decimals with no fractional part."""
+    """Mapper pads whole-number amounts to two decimal places (rate is untouched)."""
     plan = FinancingPlan(
         principal=Decimal("20000"),
         annual_rate=Decimal("0.10"),
@@ -166,8 +167,11 @@ def test_to_response_handles_whole_numbers() -> None:
 
     result = FinancingMapper.to_response(plan)
 
-    assert result.principal == "20000"
-    assert result.monthly_payment == "425"
+    assert result.principal == "20000.00"
+    assert result.monthly_payment == "425.00"
+    assert result.total_paid == "25500.00"
+    assert result.total_interest == "5500.00"
+    assert result.annual_rate == "0.10"
 
 
 def test_to_response_handles_very_precise_decimals() -> None:
@@ -242,3 +246,19 @@ def test_roundtrip_conversion_preserves_values() -> None:
     # Verify values are preserved
     assert response_dto.principal == "20000.00"
     assert response_dto.term_months == 60
+
+
+def test_module_level_aliases_map_like_static_methods() -> None:
+    """The module-level aliases the routes use produce the same results as the methods."""
+    dto = FinancingRequestDTO(price="25000.00", down_payment="5000.00", term_months=60)
+    plan = FinancingPlan(
+        principal=Decimal("20000.00"),
+        annual_rate=Decimal("0.10"),
+        term_months=60,
+        monthly_payment=Decimal("424.94"),
+        total_paid=Decimal("25496.40"),
+        total_interest=Decimal("5496.40"),
+    )
+
+    assert financing_mapper.to_domain_request(dto) == FinancingMapper.to_domain_request(dto)
+    assert financing_mapper.to_response(plan) == FinancingMapper.to_response(plan)
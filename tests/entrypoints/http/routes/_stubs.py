@@ -0,0 +1,20 @@
+"""Test doubles shared by the route tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class StubUseCase:
+    """Minimal use case stand-in: records requests, then returns `result` or raises `error`."""
+
+    def __init__(self) -> None:
+        self.calls: list[Any] = []
+        self.result: Any = None
+        self.error: Exception | None = None
+
+    def execute(self, request: Any) -> Any:
+        self.calls.append(request)
+        if self.error is not None:
+            raise self.error
+        return self.result
@@ -0,0 +1,39 @@
+"""
+Shared fixtures for route tests.
+
+Each test module provides a module-scoped `router` fixture with the router
+under test; `app` mounts it under /v1 with the exception handlers registered.
+The shared `client` comes from tests/entrypoints/http/conftest.py.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from kavak_lite.entrypoints.http.exception_handlers import register_exception_handlers
+from tests.entrypoints.http.routes._stubs import StubUseCase
+
+
+@pytest.fixture(scope="module")
+def app(router: APIRouter) -> FastAPI:
+    """Create a test FastAPI app with the module's router and exception handlers."""
+    test_app = FastAPI()
+    register_exception_handlers(test_app)
+    test_app.include_router(router, prefix="/v1")
+    return test_app
+
+
+@pytest.fixture(autouse=True)
+def reset_dependency_overrides(app: FastAPI) -> Iterator[None]:
+    """Clear per-test dependency overrides on the shared app."""
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def mock_use_case() -> StubUseCase:
+    """Stub use case for testing routes in isolation."""
+    return StubUseCase()
@@ -9,57 +9,101 @@ This test suite verifies the HTTP endpoint behavior per the REST Endpoint Design
 - Route handles validation errors correctly
 
 See: docs/ADR/12-26-25-rest-endpoint-design-pattern.md
+
+The app and client are shared per module. An autouse fixture points the use
+case dependency at each test's own `StubUseCase` and clears the override
+afterwards, so tests are order-independent and safe to run in parallel
+processes, each of which builds its own module-scoped app. Read-only
+happy-path tests share one standard request/response via `standard_exchange`.
 """
 
 from __future__ import annotations
 
+import json
 from decimal import Decimal
-from unittest.mock import Mock
 
 import pytest
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
 from fastapi.testclient import TestClient
+from httpx import Response
 
 from kavak_lite.domain.errors import ValidationError
 from kavak_lite.domain.financing import FinancingPlan
 from kavak_lite.entrypoints.http.dependencies import get_calculate_financing_plan_use_case
-from kavak_lite.entrypoints.http.routes.financing import router
-
-
-@pytest.fixture
-def app() -> FastAPI:
-    """Create a test FastAPI app with financing router and exception handlers."""
-    from kavak_lite.entrypoints.http.exception_handlers import register_exception_handlers
+from kavak_lite.entrypoints.http.routes.financing import router as financing_router
+from tests.entrypoints.http.routes._stubs import StubUseCase
 
-    test_app = FastAPI()
-    register_exception_handlers(test_app)
-    test_app.include_router(router, prefix="/v1")
-    return test_app
 
+@pytest.fixture(scope="module")
+def router() -> APIRouter:
+    """Router under test, mounted by the shared app fixture."""
+    return financing_router
 
-@pytest.fixture
-def client(app: FastAPI) -> TestClient:
-    """Create a test client."""
-    return TestClient(app, raise_server_exceptions=False)
 
-
-@pytest.fixture
-def mock_use_case() -> Mock:
-    """Mock use case for testing route in isolation."""
-    return Mock()
+@pytest.fixture(autouse=True)
+def wire_use_case(app: FastAPI, mock_use_case: StubUseCase) -> None:
+    """Route every test's requests to its stub use case (cleared by the shared reset)."""
+    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
 
 
-@pytest.fixture
-def sample_plan() -> FinancingPlan:
-    """Sample financing plan for test responses."""
-    return FinancingPlan(
+PLAN_URL = "/v1/financing/plan"
+RESPONSE_FIELDS = {
+    "principal",
+    "annual_rate",
+    "term_months",
+    "monthly_payment",
+    "total_paid",
+    "total_interest",
+}
+
+# The common request body is encoded once here rather than by httpx on every request.
+JSON_HEADERS = {"content-type": "application/json"}
+STANDARD_REQUEST_BODY = json.dumps(
+    {"price": "25000.00", "down_payment": "5000.00", "term_months": 60}
+).encode()
+
+# Use case results are frozen dataclasses, so tests share these prebuilt instances.
+SAMPLE_PLAN = FinancingPlan(
+    principal=Decimal("20000.00"),
+    annual_rate=Decimal("0.10"),
+    term_months=60,
+    monthly_payment=Decimal("424.94"),
+    total_paid=Decimal("25496.40"),
+    total_interest=Decimal("5496.40"),
+)
+ZERO_DOWN_PLAN = FinancingPlan(
+    principal=Decimal("25000.00"),
+    annual_rate=Decimal("0.10"),
+    term_months=60,
+    monthly_payment=Decimal("531.18"),
+    total_paid=Decimal("31870.80"),
+    total_interest=Decimal("6870.80"),
+)
+
+PLANS_BY_TERM = {
+    term: FinancingPlan(
         principal=Decimal("20000.00"),
         annual_rate=Decimal("0.10"),
-        term_months=60,
-        monthly_payment=Decimal("424.94"),
-        total_paid=Decimal("25496.40"),
-        total_interest=Decimal("5496.40"),
+        term_months=term,
+        monthly_payment=Decimal("500.00"),
+        total_paid=Decimal(500 * term),
+        total_interest=Decimal("5000.00"),
     )
+    for term in (36, 48, 60, 72)
+}
+
+
+@pytest.fixture(scope="module")
+def standard_exchange(app: FastAPI, client: TestClient) -> tuple[Response, StubUseCase]:
+    """POST the standard request once per module; read-only tests share the result."""
+    use_case = StubUseCase()
+    use_case.result = SAMPLE_PLAN
+    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: use_case
+    try:
+        response = client.post(PLAN_URL, content=STANDARD_REQUEST_BODY, headers=JSON_HEADERS)
+    finally:
+        del app.dependency_overrides[get_calculate_financing_plan_use_case]
+    return response, use_case
 
 
 # ==============================================================================
@@ -68,33 +112,16 @@ def sample_plan() -> FinancingPlan:
 
 
 def test_calculate_financing_plan_success(
-    app: FastAPI, client: TestClient, mock_use_case: Mock, sample_plan: FinancingPlan
+    standard_exchange: tuple[Response, StubUseCase],
 ) -> None:
     """Route successfully calculates financing plan with valid input."""
-    mock_use_case.execute.return_value = sample_plan
-
-    # Override dependency
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
-
-    response = client.post(
-        "/v1/financing/plan",
-        json={
-            "price": "25000.00",
-            "down_payment": "5000.00",
-            "term_months": 60,
-        },
-    )
+    response, use_case = standard_exchange
 
     assert response.status_code == 200
     data = response.json()
 
     # Verify response structure
-    assert "principal" in data
-    assert "annual_rate" in data
-    assert "term_months" in data
-    assert "monthly_payment" in data
-    assert "total_paid" in data
-    assert "total_interest" in data
+    assert data.keys() >= RESPONSE_FIELDS
 
     # Verify response values are strings (not floats)
     assert data["principal"] == "20000.00"
@@ -105,14 +132,14 @@ def test_calculate_financing_plan_success(
     assert data["total_interest"] == "5496.40"
 
     # Verify use case was called
-    mock_use_case.execute.assert_called_once()
+    assert len(use_case.calls) == 1
 
 
 def test_calculate_financing_plan_preserves_decimal_precision(
-    app: FastAPI, client: TestClient, mock_use_case: Mock
+    client: TestClient, mock_use_case: StubUseCase
 ) -> None:
     """Route preserves exact decimal precision in response."""
-    mock_use_case.execute.return_value = FinancingPlan(
+    mock_use_case.result = FinancingPlan(
         principal=Decimal("15000.00"),
         annual_rate=Decimal("0.10"),
         term_months=48,
@@ -121,10 +148,8 @@ def test_calculate_financing_plan_preserves_decimal_precision(
         total_interest=Decimal("3261.12"),
     )
 
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
-
     response = client.post(
-        "/v1/financing/plan",
+        PLAN_URL,
         json={
             "price": "15000.00",
             "down_payment": "0",
@@ -140,53 +165,35 @@ def test_calculate_financing_plan_preserves_decimal_precision(
     assert data["total_paid"] == "18261.12"
 
 
+@pytest.mark.parametrize("term", sorted(PLANS_BY_TERM))
 def test_calculate_financing_plan_with_various_terms(
-    app: FastAPI, client: TestClient, mock_use_case: Mock
+    client: TestClient, mock_use_case: StubUseCase, term: int
 ) -> None:
     """Route works with all allowed loan terms."""
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
+    mock_use_case.result = PLANS_BY_TERM[term]
+
+    response = client.post(
+        PLAN_URL,
+        json={
+            "price": "25000.00",
+            "down_payment": "5000.00",
+            "term_months": term,
+        },
+    )
 
-    for term in [36, 48, 60, 72]:
-        mock_use_case.execute.return_value = FinancingPlan(
-            principal=Decimal("20000.00"),
-            annual_rate=Decimal("0.10"),
-            term_months=term,
-            monthly_payment=Decimal("500.00"),
-            total_paid=Decimal(str(500 * term)),
-            total_interest=Decimal("5000.00"),
-        )
-
-        response = client.post(
-            "/v1/financing/plan",
-            json={
-                "price": "25000.00",
-                "down_payment": "5000.00",
-                "term_months": term,
-            },
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["term_months"] == term
+    assert response.status_code == 200
+    data = response.json()
+    assert data["term_months"] == term
 
 
 def test_calculate_financing_plan_with_zero_down_payment(
-    app: FastAPI, client: TestClient, mock_use_case: Mock
+    client: TestClient, mock_use_case: StubUseCase
 ) -> None:
     """Route handles zero down payment correctly."""
-    mock_use_case.execute.return_value = FinancingPlan(
-        principal=Decimal("25000.00"),
-        annual_rate=Decimal("0.10"),
-        term_months=60,
-        monthly_payment=Decimal("531.18"),
-        total_paid=Decimal("31870.80"),
-        total_interest=Decimal("6870.80"),
-    )
-
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
+    mock_use_case.result = ZERO_DOWN_PLAN
 
     response = client.post(
-        "/v1/financing/plan",
+        PLAN_URL,
         json={
             "price": "25000.00",
             "down_payment": "0",
@@ -201,13 +208,14 @@ def test_calculate_financing_plan_with_zero_down_payment(
 
 # ==============================================================================
 # Pydantic Validation Errors - Request Body
+# (field-level rules are covered in tests/entrypoints/http/dtos/test_financing.py)
 # ==============================================================================
 
 
-def test_rejects_invalid_price_format(app: FastAPI, client: TestClient) -> None:
+def test_rejects_invalid_price_format(client: TestClient) -> None:
     """Route rejects price with invalid decimal format."""
     response = client.post(
-        "/v1/financing/plan",
+        PLAN_URL,
         json={
             "price": "abc",
             "down_payment": "5000.00",
@@ -220,85 +228,14 @@ def test_rejects_invalid_price_format(app: FastAPI, client: TestClient) -> None:
     assert "detail" in data
 
 
-def test_rejects_price_with_too_many_decimals(app: FastAPI, client: TestClient) -> None:
-    """Route rejects price with more than 2 decimal places."""
-    response = client.post(
-        "/v1/financing/plan",
-        json={
-            "price": "25000.123",
-            "down_payment": "5000.00",
-            "term_months": 60,
-        },
-    )
-
-    assert response.status_code == 422
-
-
-def test_rejects_negative_term_months(app: FastAPI, client: TestClient) -> None:
-    """Route rejects negative term_months."""
-    response = client.post(
-        "/v1/financing/plan",
-        json={
-            "price": "25000.00",
-            "down_payment": "5000.00",
-            "term_months": -1,
-        },
-    )
-
-    assert response.status_code == 422
-
-
-def test_rejects_missing_required_fields(app: FastAPI, client: TestClient) -> None:
-    """Route rejects request with missing required fields."""
-    response = client.post(
-        "/v1/financing/plan",
-        json={
-            "price": "25000.00",
-            # Missing down_payment and term_months
-        },
-    )
-
-    assert response.status_code == 422
-
-
-def test_rejects_price_with_special_characters(app: FastAPI, client: TestClient) -> None:
-    """Route rejects price with currency symbols or commas."""
-    response = client.post(
-        "/v1/financing/plan",
-        json={
-            "price": "$25,000.00",
-            "down_payment": "5000.00",
-            "term_months": 60,
-        },
-    )
-
-    assert response.status_code == 422
-
-
-def test_rejects_empty_string_for_price(app: FastAPI, client: TestClient) -> None:
-    """Route rejects empty string for monetary fields."""
-    response = client.post(
-        "/v1/financing/plan",
-        json={
-            "price": "",
-            "down_payment": "5000.00",
-            "term_months": 60,
-        },
-    )
-
-    assert response.status_code == 422
-
-
 # ==============================================================================
 # Domain Validation Errors
 # ==============================================================================
 
 
-def test_handles_invalid_term_from_domain(
-    app: FastAPI, client: TestClient, mock_use_case: Mock
-) -> None:
+def test_handles_invalid_term_from_domain(client: TestClient, mock_use_case: StubUseCase) -> None:
     """Route handles domain ValidationError for invalid term."""
-    mock_use_case.execute.side_effect = ValidationError(
+    mock_use_case.error = ValidationError(
         errors=[
             {
                 "field": "term_months",
@@ -308,10 +245,8 @@ def test_handles_invalid_term_from_domain(
         ]
     )
 
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
-
     response = client.post(
-        "/v1/financing/plan",
+        PLAN_URL,
         json={
             "price": "25000.00",
             "down_payment": "5000.00",
@@ -330,10 +265,10 @@ def test_handles_invalid_term_from_domain(
 
 
 def test_handles_price_less_than_or_equal_zero(
-    app: FastAPI, client: TestClient, mock_use_case: Mock
+    client: TestClient, mock_use_case: StubUseCase
 ) -> None:
     """Route handles domain ValidationError for non-positive price."""
-    mock_use_case.execute.side_effect = ValidationError(
+    mock_use_case.error = ValidationError(
         errors=[
             {
                 "field": "price",
@@ -343,10 +278,8 @@ def test_handles_price_less_than_or_equal_zero(
         ]
     )
 
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
-
     response = client.post(
-        "/v1/financing/plan",
+        PLAN_URL,
         json={
             "price": "0",
             "down_payment": "0",
@@ -360,10 +293,10 @@ def test_handles_price_less_than_or_equal_zero(
 
 
 def test_handles_down_payment_greater_than_price(
-    app: FastAPI, client: TestClient, mock_use_case: Mock
+    client: TestClient, mock_use_case: StubUseCase
 ) -> None:
     """Route handles domain ValidationError for down payment >= price."""
-    mock_use_case.execute.side_effect = ValidationError(
+    mock_use_case.error = ValidationError(
         errors=[
             {
                 "field": "down_payment",
@@ -373,10 +306,8 @@ def test_handles_down_payment_greater_than_price(
         ]
     )
 
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
-
     response = client.post(
-        "/v1/financing/plan",
+        PLAN_URL,
         json={
             "price": "25000.00",
             "down_payment": "30000.00",
@@ -389,11 +320,9 @@ def test_handles_down_payment_greater_than_price(
     assert "errors" in data
 
 
-def test_handles_negative_down_payment(
-    app: FastAPI, client: TestClient, mock_use_case: Mock
-) -> None:
+def test_handles_negative_down_payment(client: TestClient, mock_use_case: StubUseCase) -> None:
     """Route handles domain ValidationError for negative down payment."""
-    mock_use_case.execute.side_effect = ValidationError(
+    mock_use_case.error = ValidationError(
         errors=[
             {
                 "field": "down_payment",
@@ -403,10 +332,8 @@ def test_handles_negative_down_payment(
         ]
     )
 
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
-
     response = client.post(
-        "/v1/financing/plan",
+        PLAN_URL,
         json={
             "price": "25000.00",
             "down_payment": "-1000.00",
@@ -422,53 +349,11 @@ def test_handles_negative_down_payment(
 # ==============================================================================
 
 
-def test_response_has_correct_structure(
-    app: FastAPI, client: TestClient, mock_use_case: Mock, sample_plan: FinancingPlan
-) -> None:
-    """Route returns response with all required fields."""
-    mock_use_case.execute.return_value = sample_plan
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
-
-    response = client.post(
-        "/v1/financing/plan",
-        json={
-            "price": "25000.00",
-            "down_payment": "5000.00",
-            "term_months": 60,
-        },
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-
-    # All required fields must be present
-    required_fields = [
-        "principal",
-        "annual_rate",
-        "term_months",
-        "monthly_payment",
-        "total_paid",
-        "total_interest",
-    ]
-    for field in required_fields:
-        assert field in data
-
-
 def test_response_monetary_fields_are_strings(
-    app: FastAPI, client: TestClient, mock_use_case: Mock, sample_plan: FinancingPlan
+    standard_exchange: tuple[Response, StubUseCase],
 ) -> None:
     """Route returns monetary values as strings, not floats."""
-    mock_use_case.execute.return_value = sample_plan
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
-
-    response = client.post(
-        "/v1/financing/plan",
-        json={
-            "price": "25000.00",
-            "down_payment": "5000.00",
-            "term_months": 60,
-        },
-    )
+    response, _ = standard_exchange
 
     assert response.status_code == 200
     data = response.json()
@@ -487,49 +372,17 @@ def test_response_monetary_fields_are_strings(
 # ==============================================================================
 
 
-def test_uses_dependency_injection(
-    app: FastAPI, client: TestClient, mock_use_case: Mock, sample_plan: FinancingPlan
-) -> None:
-    """Route uses dependency injection for use case."""
-    mock_use_case.execute.return_value = sample_plan
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
-
-    response = client.post(
-        "/v1/financing/plan",
-        json={
-            "price": "25000.00",
-            "down_payment": "5000.00",
-            "term_months": 60,
-        },
-    )
-
-    assert response.status_code == 200
-
-    # Verify mock was called (dependency injection worked)
-    mock_use_case.execute.assert_called_once()
-
-
 def test_calls_use_case_with_mapped_request(
-    app: FastAPI, client: TestClient, mock_use_case: Mock, sample_plan: FinancingPlan
+    standard_exchange: tuple[Response, StubUseCase],
 ) -> None:
-    """Route passes properly mapped domain request to use case."""
-    mock_use_case.execute.return_value = sample_plan
-    app.dependency_overrides[get_calculate_financing_plan_use_case] = lambda: mock_use_case
-
-    response = client.post(
-        "/v1/financing/plan",
-        json={
-            "price": "25000.00",
-            "down_payment": "5000.00",
-            "term_months": 60,
-        },
-    )
+    """Route calls the injected use case once with a properly mapped domain request."""
+    response, use_case = standard_exchange
 
     assert response.status_code == 200
 
     # Verify use case was called with Decimal values (not strings)
-    mock_use_case.execute.assert_called_once()
-    request_arg = mock_use_case.execute.call_args[0][0]
+    assert len(use_case.calls) == 1
+    request_arg = use_case.calls[0]
     assert request_arg.price == Decimal("25000.00")
     assert request_arg.down_payment == Decimal("5000.00")
     assert request_arg.term_months == 60
@@ -14,12 +14,36 @@ requiring external dependencies.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from kavak_lite.entrypoints.http.app import app as module_app
 from kavak_lite.entrypoints.http.app import build_app
 
 
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    """Build the application once per module (tests only read from it)."""
+    return build_app()
+
+
+@pytest.fixture(scope="module")
+def client(app: FastAPI) -> Iterator[TestClient]:
+    """Create a test client (shared across the module)."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def openapi_schema(app: FastAPI) -> dict[str, Any]:
+    """Generate the OpenAPI schema once per module."""
+    return app.openapi()
+
+
 # ==============================================================================
 # Application Creation
 # ==============================================================================
@@ -45,29 +69,25 @@ def test_build_app_creates_new_instance_each_call() -> None:
 # ==============================================================================
 
 
-def test_app_has_correct_title() -> None:
+def test_app_has_correct_title(app: FastAPI) -> None:
     """Application has correct title."""
-    app = build_app()
     assert app.title == "Kavak Lite API"
 
 
-def test_app_has_correct_version() -> None:
+def test_app_has_correct_version(app: FastAPI) -> None:
     """Application has correct version."""
-    app = build_app()
     assert app.version == "0.1.0"
 
 
-def test_app_has_description() -> None:
+def test_app_has_description(app: FastAPI) -> None:
     """Application has description."""
-    app = build_app()
     assert app.description is not None
     assert len(app.description) > 0
     assert "Car marketplace API" in app.description
 
 
-def test_app_has_contact_info() -> None:
+def test_app_has_contact_info(app: FastAPI) -> None:
     """Application has contact information."""
-    app = build_app()
     assert app.contact is not None
     assert "name" in app.contact
     assert app.contact["name"] == "Kavak Lite Team"
@@ -75,9 +95,8 @@ def test_app_has_contact_info() -> None:
     assert app.contact["email"] == "dev@kavak-lite.com"
 
 
-def test_app_has_license_info() -> None:
+def test_app_has_license_info(app: FastAPI) -> None:
     """Application has license information."""
-    app = build_app()
     assert app.license_info is not None
     assert "name" in app.license_info
     assert app.license_info["name"] == "Proprietary"
@@ -88,29 +107,23 @@ def test_app_has_license_info() -> None:
 # ==============================================================================
 
 
-def test_app_has_swagger_ui_enabled() -> None:
+def test_app_has_swagger_ui_enabled(app: FastAPI) -> None:
     """Application has Swagger UI enabled at /docs."""
-    app = build_app()
     assert app.docs_url == "/docs"
 
 
-def test_app_has_redoc_enabled() -> None:
+def test_app_has_redoc_enabled(app: FastAPI) -> None:
     """Application has ReDoc enabled at /redoc."""
-    app = build_app()
     assert app.redoc_url == "/redoc"
 
 
-def test_app_has_openapi_schema_endpoint() -> None:
+def test_app_has_openapi_schema_endpoint(app: FastAPI) -> None:
     """Application has OpenAPI schema at /openapi.json."""
-    app = build_app()
     assert app.openapi_url == "/openapi.json"
 
 
-def test_app_documentation_endpoints_are_accessible() -> None:
+def test_app_documentation_endpoints_are_accessible(client: TestClient) -> None:
     """Documentation endpoints are accessible."""
-    app = build_app()
-    client = TestClient(app)
-
     # Swagger UI
     response = client.get("/docs")
     assert response.status_code == 200
@@ -130,22 +143,16 @@ def test_app_documentation_endpoints_are_accessible() -> None:
 # ==============================================================================
 
 
-def test_app_includes_health_router() -> None:
+def test_app_includes_health_router(client: TestClient) -> None:
     """Application includes health router."""
-    app = build_app()
-    client = TestClient(app)
-
     # Health endpoint should be accessible
     response = client.get("/health")
     assert response.status_code == 200
 
 
-def test_app_includes_cars_router_with_v1_prefix() -> None:
+def test_app_includes_cars_router_with_v1_prefix(openapi_schema: dict[str, Any]) -> None:
     """Application includes cars router with /v1 prefix."""
-    app = build_app()
-
     # Verify via OpenAPI schema (doesn't trigger dependencies)
-    openapi_schema = app.openapi()
     paths = openapi_schema["paths"]
 
     # Cars endpoint should NOT be at /cars
@@ -155,13 +162,8 @@ def test_app_includes_cars_router_with_v1_prefix() -> None:
     assert "/v1/cars" in paths
 
 
-def test_app_has_routes_registered() -> None:
+def test_app_has_routes_registered(openapi_schema: dict[str, Any]) -> None:
     """Application has routes registered in OpenAPI schema."""
-    app = build_app()
-
-    # Get OpenAPI schema
-    openapi_schema = app.openapi()
-
     # Verify paths are registered
     assert "paths" in openapi_schema
     paths = openapi_schema["paths"]
@@ -178,50 +180,38 @@ def test_app_has_routes_registered() -> None:
 # ==============================================================================
 
 
-def test_app_openapi_schema_has_required_fields() -> None:
+def test_app_openapi_schema_has_required_fields(openapi_schema: dict[str, Any]) -> None:
     """OpenAPI schema has all required fields."""
-    app = build_app()
-    schema = app.openapi()
-
     # Required OpenAPI fields
-    assert "openapi" in schema
-    assert "info" in schema
-    assert "paths" in schema
+    assert "openapi" in openapi_schema
+    assert "info" in openapi_schema
+    assert "paths" in openapi_schema
 
     # Info object
-    assert "title" in schema["info"]
-    assert "version" in schema["info"]
-    assert schema["info"]["title"] == "Kavak Lite API"
-    assert schema["info"]["version"] == "0.1.0"
+    assert "title" in openapi_schema["info"]
+    assert "version" in openapi_schema["info"]
+    assert openapi_schema["info"]["title"] == "Kavak Lite API"
+    assert openapi_schema["info"]["version"] == "0.1.0"
 
 
-def test_app_openapi_schema_includes_contact() -> None:
+def test_app_openapi_schema_includes_contact(openapi_schema: dict[str, Any]) -> None:
     """OpenAPI schema includes contact information."""
-    app = build_app()
-    schema = app.openapi()
-
-    assert "info" in schema
-    assert "contact" in schema["info"]
-    assert schema["info"]["contact"]["name"] == "Kavak Lite Team"
+    assert "info" in openapi_schema
+    assert "contact" in openapi_schema["info"]
+    assert openapi_schema["info"]["contact"]["name"] == "Kavak Lite Team"
 
 
-def test_app_openapi_schema_includes_license() -> None:
+def test_app_openapi_schema_includes_license(openapi_schema: dict[str, Any]) -> None:
     """OpenAPI schema includes license information."""
-    app = build_app()
-    schema = app.openapi()
+    assert "info" in openapi_schema
+    assert "license" in openapi_schema["info"]
+    assert openapi_schema["info"]["license"]["name"] == "Proprietary"
 
-    assert "info" in schema
-    assert "license" in schema["info"]
-    assert schema["info"]["license"]["name"] == "Proprietary"
 
-
-def test_app_openapi_schema_documents_health_endpoint() -> None:
+def test_app_openapi_schema_documents_health_endpoint(openapi_schema: dict[str, Any]) -> None:
     """OpenAPI schema documents /health endpoint."""
-    app = build_app()
-    schema = app.openapi()
-
-    assert "/health" in schema["paths"]
-    health_path = schema["paths"]["/health"]
+    assert "/health" in openapi_schema["paths"]
+    health_path = openapi_schema["paths"]["/health"]
 
     # Should have GET method
     assert "get" in health_path
@@ -231,13 +221,10 @@ def test_app_openapi_schema_documents_health_endpoint() -> None:
     assert "health" in health_path["get"]["tags"]
 
 
-def test_app_openapi_schema_documents_cars_endpoint() -> None:
+def test_app_openapi_schema_documents_cars_endpoint(openapi_schema: dict[str, Any]) -> None:
     """OpenAPI schema documents /v1/cars endpoint."""
-    app = build_app()
-    schema = app.openapi()
-
-    assert "/v1/cars" in schema["paths"]
-    cars_path = schema["paths"]["/v1/cars"]
+    assert "/v1/cars" in openapi_schema["paths"]
+    cars_path = openapi_schema["paths"]["/v1/cars"]
 
     # Should have GET method
     assert "get" in cars_path
@@ -269,23 +256,17 @@ def test_app_openapi_schema_documents_cars_endpoint() -> None:
 # ==============================================================================
 
 
-def test_health_endpoint_responds() -> None:
+def test_health_endpoint_responds(client: TestClient) -> None:
     """Health endpoint returns successful response."""
-    app = build_app()
-    client = TestClient(app)
-
     response = client.get("/health")
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
 
 
-def test_cars_endpoint_exists_at_correct_path() -> None:
+def test_cars_endpoint_exists_at_correct_path(openapi_schema: dict[str, Any]) -> None:
     """Cars endpoint exists at /v1/cars (not at /cars)."""
-    app = build_app()
-
     # Verify via OpenAPI schema (doesn't trigger dependencies)
-    openapi_schema = app.openapi()
     paths = openapi_schema["paths"]
 
     # Should NOT exist at /cars
@@ -295,11 +276,8 @@ def test_cars_endpoint_exists_at_correct_path() -> None:
     assert "/v1/cars" in paths
 
 
-def test_app_returns_404_for_unknown_routes() -> None:
+def test_app_returns_404_for_unknown_routes(client: TestClient) -> None:
     """Application returns 404 for unknown routes."""
-    app = build_app()
-    client = TestClient(app)
-
     response = client.get("/unknown")
     assert response.status_code == 404
 
@@ -314,16 +292,12 @@ def test_app_returns_404_for_unknown_routes() -> None:
 
 def test_app_module_exports_app_instance() -> None:
     """App module exports 'app' instance at module level."""
-    from kavak_lite.entrypoints.http.app import app
-
-    assert isinstance(app, FastAPI)
+    assert isinstance(module_app, FastAPI)
 
 
 def test_module_level_app_is_from_build_app() -> None:
     """Module-level app instance is created via build_app()."""
-    from kavak_lite.entrypoints.http.app import app
-
     # Should have same configuration as build_app()
-    assert app.title == "Kavak Lite API"
-    assert app.version == "0.1.0"
-    assert app.docs_url == "/docs"
+    assert module_app.title == "Kavak Lite API"
+    assert module_app.version == "0.1.0"
+    assert module_app.docs_url == "/docs"
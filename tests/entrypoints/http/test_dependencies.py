@@ -5,9 +5,9 @@ This test suite verifies the dependency wiring logic per the Database Session Pe
 - get_db() yields a database session per request
 - get_search_catalog_use_case() creates properly wired use case with repository
 - get_get_car_by_id_use_case() creates properly wired use case with repository
-- get_calculate_financing_plan_use_case() creates stateless use case
+- get_calculate_financing_plan_use_case() shares one stateless use case
 - No caching of sessions or stateful objects
-- Each request gets fresh instances
+- Each request gets fresh session-bound instances
 
 Tests use mocks to verify wiring without requiring a real database.
 
@@ -16,12 +16,16 @@ See: docs/ADR/12-29-25-database-session-per-request.md
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, Mock, patch
+from typing import cast
+from unittest.mock import MagicMock, Mock
 
+import pytest
+from sqlalchemy.orm import Session
 
 from kavak_lite.adapters.postgres_car_catalog_repository import (
     PostgresCarCatalogRepository,
 )
+from kavak_lite.entrypoints.http import dependencies
 from kavak_lite.entrypoints.http.dependencies import (
     get_calculate_financing_plan_use_case,
     get_db,
@@ -32,104 +36,124 @@ from kavak_lite.use_cases.calculate_financing_plan import CalculateFinancingPlan
 from kavak_lite.use_cases.get_car_by_id import GetCarById
 from kavak_lite.use_cases.search_car_catalog import SearchCarCatalog
 
+# dependencies.py postpones annotation evaluation, so the raw return annotations
+# are source strings; comparing those avoids resolving them via get_type_hints().
+_RETURN_ANNOTATIONS = {
+    factory: factory.__annotations__["return"]
+    for factory in (
+        get_db,
+        get_search_catalog_use_case,
+        get_get_car_by_id_use_case,
+        get_calculate_financing_plan_use_case,
+    )
+}
+
+
+def _session() -> Session:
+    """Fresh Session stand-in; the wiring tests only compare it by identity."""
+    return cast(Session, object())
+
+
+def _session_context(session: Session) -> MagicMock:
+    """Context manager stand-in for get_session() that yields `session`."""
+    context_manager = MagicMock()
+    context_manager.__enter__.return_value = session
+    context_manager.__exit__.return_value = None
+    return context_manager
+
 
 # ==============================================================================
 # get_db() - Database Session Provider
 # ==============================================================================
 
 
-def test_get_db_yields_session_from_get_session() -> None:
+def test_get_db_yields_session_from_get_session(monkeypatch: pytest.MonkeyPatch) -> None:
     """get_db() yields a session from the get_session context manager."""
     # Mock get_session to return a context manager
-    mock_session = Mock()
-    mock_context_manager = MagicMock()
-    mock_context_manager.__enter__.return_value = mock_session
-    mock_context_manager.__exit__.return_value = None
+    mock_session = _session()
+    mock_context_manager = _session_context(mock_session)
 
-    with patch("kavak_lite.entrypoints.http.dependencies.get_session") as mock_get_session:
-        mock_get_session.return_value = mock_context_manager
+    mock_get_session = Mock(return_value=mock_context_manager)
+    monkeypatch.setattr(dependencies, "get_session", mock_get_session)
 
-        # Call get_db and consume the generator
-        generator = get_db()
-        session = next(generator)
+    # Call get_db and consume the generator
+    generator = get_db()
+    session = next(generator)
 
-        # Verify get_session was called
-        mock_get_session.assert_called_once()
+    # Verify get_session was called
+    mock_get_session.assert_called_once()
 
-        # Verify the yielded value is the session
-        assert session is mock_session
+    # Verify the yielded value is the session
+    assert session is mock_session
 
-        # Complete the generator (simulates FastAPI cleanup)
-        try:
-            next(generator)
-        except StopIteration:
-            pass  # Expected
+    # Complete the generator (simulates FastAPI cleanup)
+    try:
+        next(generator)
+    except StopIteration:
+        pass  # Expected
 
-        # Verify context manager was entered and exited
-        mock_context_manager.__enter__.assert_called_once()
-        mock_context_manager.__exit__.assert_called_once()
+    # Verify context manager was entered and exited
+    mock_context_manager.__enter__.assert_called_once()
+    mock_context_manager.__exit__.assert_called_once()
 
 
-def test_get_db_is_generator() -> None:
+def test_get_db_is_generator(monkeypatch: pytest.MonkeyPatch) -> None:
     """get_db() is a generator function (required for FastAPI dependency)."""
     from types import GeneratorType
 
-    with patch("kavak_lite.entrypoints.http.dependencies.get_session"):
-        result = get_db()
-        assert isinstance(result, GeneratorType)
+    monkeypatch.setattr(dependencies, "get_session", Mock())
 
+    result = get_db()
+    assert isinstance(result, GeneratorType)
 
-def test_get_db_properly_closes_session_on_exception() -> None:
+
+def test_get_db_properly_closes_session_on_exception(monkeypatch: pytest.MonkeyPatch) -> None:
     """get_db() ensures session is closed even if exception occurs."""
-    mock_session = Mock()
-    mock_context_manager = MagicMock()
-    mock_context_manager.__enter__.return_value = mock_session
+    mock_session = _session()
+    mock_context_manager = _session_context(mock_session)
 
-    with patch("kavak_lite.entrypoints.http.dependencies.get_session") as mock_get_session:
-        mock_get_session.return_value = mock_context_manager
+    mock_get_session = Mock(return_value=mock_context_manager)
+    monkeypatch.setattr(dependencies, "get_session", mock_get_session)
 
-        generator = get_db()
-        next(generator)  # Get the session
+    generator = get_db()
+    next(generator)  # Get the session
 
-        # Simulate exception during request processing
-        try:
-            generator.throw(Exception("Simulated error during request"))
-        except Exception:
-            pass  # Expected
+    # Simulate exception during request processing
+    try:
+        generator.throw(Exception("Simulated error during request"))
+    except Exception:
+        pass  # Expected
 
-        # Verify context manager __exit__ was called (cleanup happened)
-        mock_context_manager.__exit__.assert_called_once()
+    # Verify context manager __exit__ was called (cleanup happened)
+    mock_context_manager.__exit__.assert_called_once()
 
 
-def test_get_db_creates_new_session_each_call() -> None:
+def test_get_db_creates_new_session_each_call(monkeypatch: pytest.MonkeyPatch) -> None:
     """get_db() creates a new session for each call (not cached)."""
-    mock_session_1 = Mock()
-    mock_session_2 = Mock()
+    mock_session_1 = _session()
+    mock_session_2 = _session()
 
-    mock_cm_1 = MagicMock()
-    mock_cm_1.__enter__.return_value = mock_session_1
-    mock_cm_1.__exit__.return_value = None
+    mock_cm_1 = _session_context(mock_session_1)
+    mock_cm_2 = _session_context(mock_session_2)
 
-    mock_cm_2 = MagicMock()
-    mock_cm_2.__enter__.return_value = mock_session_2
-    mock_cm_2.__exit__.return_value = None
+    mock_get_session = Mock()
+    monkeypatch.setattr(dependencies, "get_session", mock_get_session)
 
-    with patch("kavak_lite.entrypoints.http.dependencies.get_session") as mock_get_session:
-        # First call
-        mock_get_session.return_value = mock_cm_1
-        gen1 = get_db()
-        session1 = next(gen1)
+    # First call
+    mock_get_session.return_value = mock_cm_1
+    gen1 = get_db()
+    session1 = next(gen1)
 
-        # Second call
-        mock_get_session.return_value = mock_cm_2
-        gen2 = get_db()
-        session2 = next(gen2)
+    # Second call
+    mock_get_session.return_value = mock_cm_2
+    gen2 = get_db()
+    session2 = next(gen2)
 
-        # Verify get_session called twice (not cached)
-        assert mock_get_session.call_count == 2
+    # Verify get_session called twice (not cached)
+    assert mock_get_session.call_count == 2
 
-        # Verify different sessions
-        assert session1 is not session2
+    # Verify different sessions
+    assert session1 is not session2
 
 
 # ==============================================================================
@@ -139,7 +163,7 @@ def test_get_db_creates_new_session_each_call() -> None:
 
 def test_get_search_catalog_use_case_creates_use_case_with_repository() -> None:
     """Factory creates SearchCarCatalog use case with PostgresCarCatalogRepository."""
-    mock_session = Mock()
+    mock_session = _session()
 
     # Call the factory
     use_case = get_search_catalog_use_case(db=mock_session)
@@ -147,22 +171,20 @@ def test_get_search_catalog_use_case_creates_use_case_with_repository() -> None:
     # Verify use case is correct type
     assert isinstance(use_case, SearchCarCatalog)
 
-    # Verify use case has repository
-    assert hasattr(use_case, "_repository")
+    # Verify use case has repository (a missing attribute raises AttributeError)
     repository = use_case._repository
 
     # Verify repository is correct type
     assert isinstance(repository, PostgresCarCatalogRepository)
 
     # Verify repository has the session
-    assert hasattr(repository, "_session")
     assert repository._session is mock_session
 
 
 def test_get_search_catalog_use_case_creates_fresh_instance_each_call() -> None:
     """Factory creates new use case instance for each call (not cached)."""
-    mock_session_1 = Mock()
-    mock_session_2 = Mock()
+    mock_session_1 = _session()
+    mock_session_2 = _session()
 
     # First call
     use_case_1 = get_search_catalog_use_case(db=mock_session_1)
@@ -183,7 +205,7 @@ def test_get_search_catalog_use_case_creates_fresh_instance_each_call() -> None:
 
 def test_get_search_catalog_use_case_wires_dependencies_correctly() -> None:
     """Factory wires dependencies in correct order: Session → Repository → UseCase."""
-    mock_session = Mock()
+    mock_session = _session()
 
     use_case = get_search_catalog_use_case(db=mock_session)
 
@@ -201,7 +223,7 @@ def test_get_search_catalog_use_case_wires_dependencies_correctly() -> None:
 
 def test_get_search_catalog_use_case_accepts_session_parameter() -> None:
     """Factory accepts db parameter (injected by FastAPI via Depends(get_db))."""
-    mock_session = Mock()
+    mock_session = _session()
 
     # Should accept session as parameter
     use_case = get_search_catalog_use_case(db=mock_session)
@@ -217,7 +239,7 @@ def test_get_search_catalog_use_case_accepts_session_parameter() -> None:
 
 def test_get_get_car_by_id_use_case_creates_use_case_with_repository() -> None:
     """Factory creates GetCarById use case with PostgresCarCatalogRepository."""
-    mock_session = Mock()
+    mock_session = _session()
 
     # Call the factory
     use_case = get_get_car_by_id_use_case(db=mock_session)
@@ -225,22 +247,20 @@ def test_get_get_car_by_id_use_case_creates_use_case_with_repository() -> None:
     # Verify use case is correct type
     assert isinstance(use_case, GetCarById)
 
-    # Verify use case has repository
-    assert hasattr(use_case, "_repository")
+    # Verify use case has repository (a missing attribute raises AttributeError)
     repository = use_case._repository
 
     # Verify repository is correct type
     assert isinstance(repository, PostgresCarCatalogRepository)
 
     # Verify repository has the session
-    assert hasattr(repository, "_session")
     assert repository._session is mock_session
 
 
 def test_get_get_car_by_id_use_case_creates_fresh_instance_each_call() -> None:
     """Factory creates new use case instance for each call (not cached)."""
-    mock_session_1 = Mock()
-    mock_session_2 = Mock()
+    mock_session_1 = _session()
+    mock_session_2 = _session()
 
     # First call
     use_case_1 = get_get_car_by_id_use_case(db=mock_session_1)
@@ -261,7 +281,7 @@ def test_get_get_car_by_id_use_case_creates_fresh_instance_each_call() -> None:
 
 def test_get_get_car_by_id_use_case_wires_dependencies_correctly() -> None:
     """Factory wires dependencies in correct order: Session → Repository → UseCase."""
-    mock_session = Mock()
+    mock_session = _session()
 
     use_case = get_get_car_by_id_use_case(db=mock_session)
 
@@ -279,7 +299,7 @@ def test_get_get_car_by_id_use_case_wires_dependencies_correctly() -> None:
 
 def test_get_get_car_by_id_use_case_accepts_session_parameter() -> None:
     """Factory accepts db parameter (injected by FastAPI via Depends(get_db))."""
-    mock_session = Mock()
+    mock_session = _session()
 
     # Should accept session as parameter
     use_case = get_get_car_by_id_use_case(db=mock_session)
@@ -290,11 +310,7 @@ def test_get_get_car_by_id_use_case_accepts_session_parameter() -> None:
 
 def test_get_get_car_by_id_use_case_return_type_annotation() -> None:
     """get_get_car_by_id_use_case() has correct return type annotation."""
-    from typing import get_type_hints
-
-    hints = get_type_hints(get_get_car_by_id_use_case)
-    assert "return" in hints
-    assert hints["return"] == GetCarById
+    assert _RETURN_ANNOTATIONS[get_get_car_by_id_use_case] == GetCarById.__name__
 
 
 # ==============================================================================
@@ -310,16 +326,16 @@ def test_get_calculate_financing_plan_use_case_creates_use_case() -> None:
     assert isinstance(use_case, CalculateFinancingPlan)
 
 
-def test_get_calculate_financing_plan_use_case_creates_fresh_instance_each_call() -> None:
-    """Factory creates new use case instance for each call (not cached)."""
+def test_get_calculate_financing_plan_use_case_reuses_instance() -> None:
+    """Factory returns the same stateless use case on every call."""
     # First call
     use_case_1 = get_calculate_financing_plan_use_case()
 
     # Second call
     use_case_2 = get_calculate_financing_plan_use_case()
 
-    # Verify different instances (even though it's stateless)
-    assert use_case_1 is not use_case_2
+    # Verify the singleton is shared
+    assert use_case_1 is use_case_2
 
 
 def test_get_calculate_financing_plan_use_case_has_no_dependencies() -> None:
@@ -333,17 +349,16 @@ def test_get_calculate_financing_plan_use_case_has_no_dependencies() -> None:
 
 def test_get_calculate_financing_plan_use_case_return_type_annotation() -> None:
     """get_calculate_financing_plan_use_case() has correct return type annotation."""
-    from typing import get_type_hints
-
-    hints = get_type_hints(get_calculate_financing_plan_use_case)
-    assert "return" in hints
-    assert hints["return"] == CalculateFinancingPlan
+    assert (
+        _RETURN_ANNOTATIONS[get_calculate_financing_plan_use_case]
+        == CalculateFinancingPlan.__name__
+    )
 
 
-def test_get_calculate_financing_plan_use_case_is_not_cached() -> None:
-    """CalculateFinancingPlan factory is not cached (per-request instance)."""
-    # Verify it's not decorated with lru_cache
-    assert not hasattr(get_calculate_financing_plan_use_case, "__wrapped__")
+def test_get_calculate_financing_plan_use_case_is_cached() -> None:
+    """CalculateFinancingPlan factory is cached (stateless singleton)."""
+    # Verify it's decorated with lru_cache
+    assert "__wrapped__" in vars(get_calculate_financing_plan_use_case)
 
 
 # ==============================================================================
@@ -351,27 +366,25 @@ def test_get_calculate_financing_plan_use_case_is_not_cached() -> None:
 # ==============================================================================
 
 
-def test_dependency_chain_get_db_to_use_case() -> None:
+def test_dependency_chain_get_db_to_use_case(monkeypatch: pytest.MonkeyPatch) -> None:
     """Verify complete dependency chain: get_db() → get_search_catalog_use_case()."""
-    mock_session = Mock()
-    mock_context_manager = MagicMock()
-    mock_context_manager.__enter__.return_value = mock_session
-    mock_context_manager.__exit__.return_value = None
+    mock_session = _session()
+    mock_context_manager = _session_context(mock_session)
 
-    with patch("kavak_lite.entrypoints.http.dependencies.get_session") as mock_get_session:
-        mock_get_session.return_value = mock_context_manager
+    mock_get_session = Mock(return_value=mock_context_manager)
+    monkeypatch.setattr(dependencies, "get_session", mock_get_session)
 
-        # Simulate FastAPI dependency injection flow
-        # 1. FastAPI calls get_db()
-        db_generator = get_db()
-        session = next(db_generator)
+    # Simulate FastAPI dependency injection flow
+    # 1. FastAPI calls get_db()
+    db_generator = get_db()
+    session = next(db_generator)
 
-        # 2. FastAPI passes session to get_search_catalog_use_case()
-        use_case = get_search_catalog_use_case(db=session)
+    # 2. FastAPI passes session to get_search_catalog_use_case()
+    use_case = get_search_catalog_use_case(db=session)
 
-        # Verify use case has the session from get_db
-        assert use_case._repository._session is session
-        assert use_case._repository._session is mock_session
+    # Verify use case has the session from get_db
+    assert use_case._repository._session is session
+    assert use_case._repository._session is mock_session
 
 
 # ==============================================================================
@@ -382,8 +395,8 @@ def test_dependency_chain_get_db_to_use_case() -> None:
 def test_multiple_requests_get_isolated_dependencies() -> None:
     """Each request gets isolated session, repository, and use case (no sharing)."""
     # Simulate two concurrent requests
-    mock_session_1 = Mock()
-    mock_session_2 = Mock()
+    mock_session_1 = _session()
+    mock_session_2 = _session()
 
     # Request 1
     use_case_1 = get_search_catalog_use_case(db=mock_session_1)
@@ -404,15 +417,14 @@ def test_multiple_requests_get_isolated_dependencies() -> None:
 
 
 def test_dependencies_are_not_cached() -> None:
-    """Dependencies are not cached with @lru_cache (per-request instances)."""
+    """Session-bound dependencies are not cached with @lru_cache (per-request instances)."""
 
     # Verify get_db is not decorated with lru_cache
-    assert not hasattr(get_db, "__wrapped__")  # lru_cache adds __wrapped__
+    assert "__wrapped__" not in vars(get_db)  # lru_cache adds __wrapped__
 
     # Verify use case factories are not decorated with lru_cache
-    assert not hasattr(get_search_catalog_use_case, "__wrapped__")
-    assert not hasattr(get_get_car_by_id_use_case, "__wrapped__")
-    assert not hasattr(get_calculate_financing_plan_use_case, "__wrapped__")
+    assert "__wrapped__" not in vars(get_search_catalog_use_case)
+    assert "__wrapped__" not in vars(get_get_car_by_id_use_case)
 
 
 # ==============================================================================
@@ -422,20 +434,10 @@ def test_dependencies_are_not_cached() -> None:
 
 def test_get_db_return_type_annotation() -> None:
     """get_db() has correct return type annotation (Generator)."""
-    from typing import get_type_hints
-
-    hints = get_type_hints(get_db)
-    assert "return" in hints
-
     # Check it's a Generator type
-    return_type = str(hints["return"])
-    assert "Generator" in return_type
+    assert _RETURN_ANNOTATIONS[get_db].startswith("Generator[")
 
 
 def test_get_search_catalog_use_case_return_type_annotation() -> None:
     """get_search_catalog_use_case() has correct return type annotation."""
-    from typing import get_type_hints
-
-    hints = get_type_hints(get_search_catalog_use_case)
-    assert "return" in hints
-    assert hints["return"] == SearchCarCatalog
+    assert _RETURN_ANNOTATIONS[get_search_catalog_use_case] == SearchCarCatalog.__name__
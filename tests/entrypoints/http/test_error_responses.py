@@ -1,7 +1,31 @@
 """Tests for REST error response models."""
 
+import json
+
 from kavak_lite.entrypoints.http.error_responses import ErrorDetail, ErrorResponse
 
+# Schema generation is not cached by Pydantic; build each schema once for the module.
+ERROR_RESPONSE_SCHEMA = ErrorResponse.model_json_schema()
+ERROR_DETAIL_SCHEMA = ErrorDetail.model_json_schema()
+
+# Shared field errors, validated once; tests must not mutate them.
+PRICE_RANGE_ERRORS = [
+    ErrorDetail(
+        field="price_min",
+        message="Must be less than or equal to price_max",
+        code="INVALID_RANGE",
+    ),
+    ErrorDetail(
+        field="price_max",
+        message="Must be greater than or equal to price_min",
+        code="INVALID_RANGE",
+    ),
+]
+YEAR_RANGE_ERRORS = [
+    ErrorDetail(field="year_min", message="Invalid range", code="INVALID_RANGE"),
+    ErrorDetail(field="year_max", message="Invalid range", code="INVALID_RANGE"),
+]
+
 
 class TestErrorDetail:
     """Tests for ErrorDetail model."""
@@ -62,11 +86,13 @@ class TestErrorDetail:
             code="INVALID_RANGE",
         )
 
-        json_str = detail.model_dump_json()
+        payload = json.loads(detail.model_dump_json())
 
-        assert '"field":"price_max"' in json_str
-        assert '"message":"Must be greater than price_min"' in json_str
-        assert '"code":"INVALID_RANGE"' in json_str
+        assert payload == {
+            "field": "price_max",
+            "message": "Must be greater than price_min",
+            "code": "INVALID_RANGE",
+        }
 
 
 class TestErrorResponse:
@@ -90,24 +116,13 @@ class TestErrorResponse:
 
     def test_creates_error_response_with_field_errors(self) -> None:
         """ErrorResponse can include field-level errors."""
-        errors = [
-            ErrorDetail(
-                field="price_min",
-                message="Must be less than or equal to price_max",
-                code="INVALID_RANGE",
-            ),
-            ErrorDetail(
-                field="price_max",
-                message="Must be greater than or equal to price_min",
-                code="INVALID_RANGE",
-            ),
-        ]
-
-        response = ErrorResponse(detail="Validation failed", code="VALIDATION_ERROR", errors=errors)
+        response = ErrorResponse(
+            detail="Validation failed", code="VALIDATION_ERROR", errors=PRICE_RANGE_ERRORS
+        )
 
         assert response.detail == "Validation failed"
         assert response.code == "VALIDATION_ERROR"
-        assert response.errors == errors
+        assert response.errors == PRICE_RANGE_ERRORS
         assert len(response.errors) == 2
 
     def test_serializes_simple_error_to_dict(self) -> None:
@@ -143,26 +158,26 @@ class TestErrorResponse:
         """ErrorResponse serializes to JSON correctly."""
         response = ErrorResponse(detail="Conflict", code="CONFLICT")
 
-        json_str = response.model_dump_json()
+        payload = json.loads(response.model_dump_json())
 
-        assert '"detail":"Conflict"' in json_str
-        assert '"code":"CONFLICT"' in json_str
+        assert payload == {"detail": "Conflict", "code": "CONFLICT", "errors": None}
 
     def test_serializes_complex_error_to_json(self) -> None:
         """ErrorResponse serializes complex error with multiple fields."""
-        errors = [
-            ErrorDetail(field="year_min", message="Invalid range", code="INVALID_RANGE"),
-            ErrorDetail(field="year_max", message="Invalid range", code="INVALID_RANGE"),
-        ]
-
-        response = ErrorResponse(detail="Validation failed", code="VALIDATION_ERROR", errors=errors)
+        response = ErrorResponse(
+            detail="Validation failed", code="VALIDATION_ERROR", errors=YEAR_RANGE_ERRORS
+        )
 
-        json_str = response.model_dump_json()
+        payload = json.loads(response.model_dump_json())
 
-        assert '"detail":"Validation failed"' in json_str
-        assert '"code":"VALIDATION_ERROR"' in json_str
-        assert '"field":"year_min"' in json_str
-        assert '"field":"year_max"' in json_str
+        assert payload == {
+            "detail": "Validation failed",
+            "code": "VALIDATION_ERROR",
+            "errors": [
+                {"field": "year_min", "message": "Invalid range", "code": "INVALID_RANGE"},
+                {"field": "year_max", "message": "Invalid range", "code": "INVALID_RANGE"},
+            ],
+        }
 
     def test_parses_from_dict(self) -> None:
         """ErrorResponse can be parsed from dict."""
@@ -207,7 +222,7 @@ class TestErrorResponseExamples:
 
     def test_has_json_schema_examples(self) -> None:
         """ErrorResponse has json_schema_extra with examples."""
-        schema = ErrorResponse.model_json_schema()
+        schema = ERROR_RESPONSE_SCHEMA
 
         assert "examples" in schema
         assert isinstance(schema["examples"], list)
@@ -215,7 +230,7 @@ class TestErrorResponseExamples:
 
     def test_simple_error_example_is_valid(self) -> None:
         """Simple error example matches model schema."""
-        schema = ErrorResponse.model_json_schema()
+        schema = ERROR_RESPONSE_SCHEMA
         simple_example = schema["examples"][0]
 
         # Should be able to validate against the model
@@ -226,7 +241,7 @@ class TestErrorResponseExamples:
 
     def test_validation_error_example_is_valid(self) -> None:
         """Validation error example matches model schema."""
-        schema = ErrorResponse.model_json_schema()
+        schema = ERROR_RESPONSE_SCHEMA
         validation_example = schema["examples"][1]
 
         # Should be able to validate against the model
@@ -243,14 +258,14 @@ class TestErrorDetailExamples:
 
     def test_has_json_schema_example(self) -> None:
         """ErrorDetail has json_schema_extra with example."""
-        schema = ErrorDetail.model_json_schema()
+        schema = ERROR_DETAIL_SCHEMA
 
         assert "example" in schema
         assert isinstance(schema["example"], dict)
 
     def test_example_is_valid(self) -> None:
         """ErrorDetail example matches model schema."""
-        schema = ErrorDetail.model_json_schema()
+        schema = ERROR_DETAIL_SCHEMA
         example = schema["example"]
 
         # Should be able to validate against the model
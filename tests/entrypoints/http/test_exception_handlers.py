@@ -1,12 +1,16 @@
 """Tests for FastAPI exception handlers."""
 
+import logging
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import cast
 from unittest.mock import Mock, patch
 
 import pytest
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Query, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.testclient import TestClient
-from pydantic import ValidationError as PydanticValidationError
+from pydantic import BaseModel
 
 from kavak_lite.domain.errors import (
     ConflictError,
@@ -17,6 +21,7 @@ from kavak_lite.domain.errors import (
     UnauthorizedError,
     ValidationError,
 )
+from kavak_lite.entrypoints.http.error_responses import ErrorResponse
 from kavak_lite.entrypoints.http.exception_handlers import (
     handle_domain_error,
     handle_request_validation_error,
@@ -25,8 +30,11 @@ from kavak_lite.entrypoints.http.exception_handlers import (
     register_exception_handlers,
 )
 
+HANDLERS_LOGGER = "kavak_lite.entrypoints.http.exception_handlers"
+REQUIRED_ERROR_KEYS = frozenset({"detail", "code"})
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def app() -> FastAPI:
     """Create a minimal FastAPI app with exception handlers registered."""
     test_app = FastAPI()
@@ -85,10 +93,39 @@ def app() -> FastAPI:
     return test_app
 
 
-@pytest.fixture
-def client(app: FastAPI) -> TestClient:
-    """Create a test client."""
-    return TestClient(app, raise_server_exceptions=False)
+@pytest.fixture(scope="module")
+def mock_request() -> Request:
+    """Request stand-in for direct handler calls; handlers only read url.path and method."""
+    return cast(Request, SimpleNamespace(url=SimpleNamespace(path="/test"), method="GET"))
+
+
+def _missing_field_error(*loc: int | str) -> RequestValidationError:
+    """RequestValidationError for one missing field, shaped like Pydantic's errors()."""
+    return RequestValidationError(
+        errors=[{"type": "missing", "loc": loc, "msg": "Field required", "input": {}}]
+    )
+
+
+class RequestBody(BaseModel):
+    name: str
+
+
+@pytest.fixture(scope="module")
+def validation_app_client() -> Iterator[TestClient]:
+    """Client for an app whose routes fail FastAPI's own request validation."""
+    validation_app = FastAPI()
+    register_exception_handlers(validation_app)
+
+    @validation_app.get("/limit")
+    def query_route(limit: int = Query(default=20, ge=1, le=100)) -> dict:
+        return {"limit": limit}
+
+    @validation_app.post("/name")
+    def body_route(body: RequestBody) -> dict:
+        return {"name": body.name}
+
+    with TestClient(validation_app, raise_server_exceptions=False) as test_client:
+        yield test_client
 
 
 class TestValidationErrorHandler:
@@ -224,21 +261,10 @@ class TestUnexpectedErrorHandler:
 class TestPydanticValidationErrors:
     """Tests for Pydantic/FastAPI validation error handling."""
 
-    def test_pydantic_validation_error_returns_422(self) -> None:
+    def test_pydantic_validation_error_returns_422(self, validation_app_client: TestClient) -> None:
         """Pydantic validation errors return 422 with structured errors."""
-        from fastapi import Query
-
-        app = FastAPI()
-        register_exception_handlers(app)
-
-        @app.get("/test")
-        def test_route(limit: int = Query(default=20, ge=1, le=100)) -> dict:
-            return {"limit": limit}
-
-        client = TestClient(app, raise_server_exceptions=False)
-
         # Test with invalid limit (exceeds max)
-        response = client.get("/test?limit=500")
+        response = validation_app_client.get("/limit?limit=500")
 
         assert response.status_code == 422
         data = response.json()
@@ -248,24 +274,12 @@ class TestPydanticValidationErrors:
         assert "errors" in data
         assert len(data["errors"]) > 0
 
-    def test_pydantic_missing_required_field_returns_422(self) -> None:
+    def test_pydantic_missing_required_field_returns_422(
+        self, validation_app_client: TestClient
+    ) -> None:
         """Pydantic validation errors for missing fields return 422."""
-        from pydantic import BaseModel
-
-        app = FastAPI()
-        register_exception_handlers(app)
-
-        class RequestBody(BaseModel):
-            name: str
-
-        @app.post("/test")
-        def test_route(body: RequestBody) -> dict:
-            return {"name": body.name}
-
-        client = TestClient(app, raise_server_exceptions=False)
-
         # Test with missing required field
-        response = client.post("/test", json={})
+        response = validation_app_client.post("/name", json={})
 
         assert response.status_code == 422
         data = response.json()
@@ -278,9 +292,9 @@ class TestPydanticValidationErrors:
 class TestErrorResponseFormat:
     """Tests for error response format consistency."""
 
-    def test_all_errors_have_detail_and_code(self, client: TestClient) -> None:
-        """All error responses have 'detail' and 'code' fields."""
-        endpoints = [
+    @pytest.mark.parametrize(
+        "endpoint",
+        [
             "/validation-error",
             "/not-found-error",
             "/conflict-error",
@@ -288,33 +302,24 @@ class TestErrorResponseFormat:
             "/forbidden-error",
             "/value-error",
             # Note: Skipping 500 errors as TestClient doesn't return JSON for them
-        ]
-
-        for endpoint in endpoints:
-            response = client.get(endpoint)
-            data = response.json()
+        ],
+    )
+    def test_all_errors_have_detail_and_code(self, client: TestClient, endpoint: str) -> None:
+        """All error responses have 'detail' and 'code' fields."""
+        data = client.get(endpoint).json()
 
-            assert "detail" in data, f"{endpoint} missing 'detail'"
-            assert "code" in data, f"{endpoint} missing 'code'"
-            assert isinstance(data["detail"], str)
-            assert isinstance(data["code"], str)
+        assert REQUIRED_ERROR_KEYS <= data.keys()
+        assert isinstance(data["detail"], str)
+        assert isinstance(data["code"], str)
 
     def test_structured_errors_have_consistent_format(self, client: TestClient) -> None:
         """Validation errors with field-level errors have consistent format."""
         response = client.get("/validation-error-with-fields")
-        data = response.json()
 
-        assert "errors" in data
-        assert isinstance(data["errors"], list)
+        # Strict validation rejects missing or non-string field/message/code entries
+        parsed = ErrorResponse.model_validate(response.json(), strict=True)
 
-        for error in data["errors"]:
-            assert "field" in error
-            assert "message" in error
-            assert isinstance(error["field"], str)
-            assert isinstance(error["message"], str)
-            # code is optional
-            if "code" in error:
-                assert isinstance(error["code"], str)
+        assert parsed.errors
 
 
 # ==============================================================================
@@ -326,12 +331,8 @@ class TestHandleDomainErrorDirectly:
     """Tests for handle_domain_error function directly."""
 
     @pytest.mark.anyio
-    async def test_handle_domain_error_returns_json_response(self) -> None:
-        """handle_domain_error returns JSONResponse with correct structure."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
+    async def test_handle_domain_error_returns_json_response(self, mock_request: Request) -> None:
+        """handle_domain_error returns a JSON response with correct structure."""
         error = ValidationError("Test validation error")
 
         response = await handle_domain_error(mock_request, error)
@@ -340,12 +341,10 @@ class TestHandleDomainErrorDirectly:
         assert response.body is not None
 
     @pytest.mark.anyio
-    async def test_handle_domain_error_maps_status_codes_correctly(self) -> None:
+    async def test_handle_domain_error_maps_status_codes_correctly(
+        self, mock_request: Request
+    ) -> None:
         """handle_domain_error maps error codes to correct HTTP status codes."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         # Test different error types
         test_cases = [
             (ValidationError("test"), 422),
@@ -356,18 +355,15 @@ class TestHandleDomainErrorDirectly:
             (InternalError("test"), 500),
         ]
 
-        with patch("kavak_lite.entrypoints.http.exception_handlers.logger"):
-            for error, expected_status in test_cases:
-                response = await handle_domain_error(mock_request, error)
-                assert response.status_code == expected_status
+        for error, expected_status in test_cases:
+            response = await handle_domain_error(mock_request, error)
+            assert response.status_code == expected_status
 
     @pytest.mark.anyio
-    async def test_handle_domain_error_unknown_code_defaults_to_400(self) -> None:
+    async def test_handle_domain_error_unknown_code_defaults_to_400(
+        self, mock_request: Request
+    ) -> None:
         """Unknown error codes default to 400 Bad Request."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         # Create a custom DomainError with unknown code
         error = DomainError(message="Unknown error", error_code="UNKNOWN_CODE")
 
@@ -376,46 +372,38 @@ class TestHandleDomainErrorDirectly:
         assert response.status_code == 400
 
     @pytest.mark.anyio
-    async def test_handle_domain_error_logs_500_errors(self) -> None:
+    async def test_handle_domain_error_logs_500_errors(
+        self, mock_request: Request, caplog: pytest.LogCaptureFixture
+    ) -> None:
         """500-level errors are logged with error level."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         error = InternalError("Internal error occurred")
 
-        with patch("kavak_lite.entrypoints.http.exception_handlers.logger") as mock_logger:
+        with caplog.at_level(logging.INFO, logger=HANDLERS_LOGGER):
             await handle_domain_error(mock_request, error)
 
-            # Verify error was logged at error level
-            mock_logger.error.assert_called_once()
-            call_args = mock_logger.error.call_args
-            assert "Domain error occurred" in call_args[0]
+        # Verify error was logged at error level
+        assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+            (logging.ERROR, "Domain error occurred")
+        ]
 
     @pytest.mark.anyio
-    async def test_handle_domain_error_logs_400_errors_at_info_level(self) -> None:
+    async def test_handle_domain_error_logs_400_errors_at_info_level(
+        self, mock_request: Request, caplog: pytest.LogCaptureFixture
+    ) -> None:
         """400-level errors are logged at info level."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         error = ValidationError("Validation failed")
 
-        with patch("kavak_lite.entrypoints.http.exception_handlers.logger") as mock_logger:
+        with caplog.at_level(logging.INFO, logger=HANDLERS_LOGGER):
             await handle_domain_error(mock_request, error)
 
-            # Verify error was logged at info level
-            mock_logger.info.assert_called_once()
-            call_args = mock_logger.info.call_args
-            assert "Client error" in call_args[0]
+        # Verify error was logged at info level
+        assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+            (logging.INFO, "Client error")
+        ]
 
     @pytest.mark.anyio
-    async def test_handle_domain_error_includes_field_errors(self) -> None:
+    async def test_handle_domain_error_includes_field_errors(self, mock_request: Request) -> None:
         """handle_domain_error includes field errors when present."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         error = ValidationError(
             errors=[{"field": "name", "message": "Required", "code": "REQUIRED"}]
         )
@@ -431,30 +419,25 @@ class TestHandleDomainErrorDirectly:
         assert len(body["errors"]) == 1
         assert body["errors"][0]["field"] == "name"
 
+    @pytest.mark.anyio
+    async def test_handle_domain_error_reuses_body_for_repeated_errors(
+        self, mock_request: Request
+    ) -> None:
+        """Identical errors without field errors share one pre-rendered body."""
+        first = await handle_domain_error(mock_request, NotFoundError("Car", "123"))
+        second = await handle_domain_error(mock_request, NotFoundError("Car", "123"))
+
+        assert first.body is second.body
+        assert first.headers["content-type"] == "application/json"
+
 
 class TestHandleRequestValidationErrorDirectly:
     """Tests for handle_request_validation_error function directly."""
 
     @pytest.mark.anyio
-    async def test_handle_request_validation_error_returns_422(self) -> None:
+    async def test_handle_request_validation_error_returns_422(self, mock_request: Request) -> None:
         """handle_request_validation_error returns 422 status."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
-        # Create a mock Pydantic validation error
-        pydantic_error = PydanticValidationError.from_exception_data(
-            "ValidationError",
-            [
-                {
-                    "type": "missing",
-                    "loc": ("body", "name"),
-                    "msg": "Field required",
-                    "input": {},
-                }
-            ],
-        )
-        exc = RequestValidationError(errors=pydantic_error.errors())
+        exc = _missing_field_error("body", "name")
 
         response = await handle_request_validation_error(mock_request, exc)
 
@@ -467,18 +450,7 @@ class TestHandleRequestValidationErrorDirectly:
         mock_request.url.path = "/test"
         mock_request.method = "POST"
 
-        pydantic_error = PydanticValidationError.from_exception_data(
-            "ValidationError",
-            [
-                {
-                    "type": "missing",
-                    "loc": ("body", "user", "name"),
-                    "msg": "Field required",
-                    "input": {},
-                }
-            ],
-        )
-        exc = RequestValidationError(errors=pydantic_error.errors())
+        exc = _missing_field_error("body", "user", "name")
 
         response = await handle_request_validation_error(mock_request, exc)
 
@@ -490,43 +462,50 @@ class TestHandleRequestValidationErrorDirectly:
         assert body["errors"][0]["field"] == "user.name"
 
     @pytest.mark.anyio
-    async def test_handle_request_validation_error_logs_errors(self) -> None:
-        """Request validation errors are logged at info level."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
+    @pytest.mark.parametrize(
+        ("loc", "expected_field"),
+        [
+            (("path", "car_id"), "car_id"),
+            (("header", "x-request-id"), "x-request-id"),
+            (("body", "filters", "query"), "filters.query"),
+            (("body", "items", 0, "path"), "items.0.path"),
+        ],
+    )
+    async def test_handle_request_validation_error_strips_only_location_prefix(
+        self, loc: tuple[int | str, ...], expected_field: str, mock_request: Request
+    ) -> None:
+        """Only the leading request part is dropped; same-named fields are kept."""
+        exc = _missing_field_error(*loc)
 
-        pydantic_error = PydanticValidationError.from_exception_data(
-            "ValidationError",
-            [
-                {
-                    "type": "missing",
-                    "loc": ("query", "limit"),
-                    "msg": "Field required",
-                    "input": {},
-                }
-            ],
-        )
-        exc = RequestValidationError(errors=pydantic_error.errors())
+        response = await handle_request_validation_error(mock_request, exc)
 
-        with patch("kavak_lite.entrypoints.http.exception_handlers.logger") as mock_logger:
+        import json
+
+        body = json.loads(response.body)
+
+        assert body["errors"][0]["field"] == expected_field
+
+    @pytest.mark.anyio
+    async def test_handle_request_validation_error_logs_errors(
+        self, mock_request: Request, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Request validation errors are logged at info level."""
+        exc = _missing_field_error("query", "limit")
+
+        with caplog.at_level(logging.INFO, logger=HANDLERS_LOGGER):
             await handle_request_validation_error(mock_request, exc)
 
-            mock_logger.info.assert_called_once()
-            call_args = mock_logger.info.call_args
-            assert "Request validation error" in call_args[0]
+        assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+            (logging.INFO, "Request validation error")
+        ]
 
 
 class TestHandleValueErrorDirectly:
     """Tests for handle_value_error function directly."""
 
     @pytest.mark.anyio
-    async def test_handle_value_error_returns_422(self) -> None:
+    async def test_handle_value_error_returns_422(self, mock_request: Request) -> None:
         """handle_value_error returns 422 status."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         error = ValueError("Invalid decimal value")
 
         response = await handle_value_error(mock_request, error)
@@ -534,12 +513,8 @@ class TestHandleValueErrorDirectly:
         assert response.status_code == 422
 
     @pytest.mark.anyio
-    async def test_handle_value_error_includes_error_message(self) -> None:
+    async def test_handle_value_error_includes_error_message(self, mock_request: Request) -> None:
         """handle_value_error includes error message in response."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         error = ValueError("Invalid format")
 
         response = await handle_value_error(mock_request, error)
@@ -552,50 +527,40 @@ class TestHandleValueErrorDirectly:
         assert body["code"] == "INVALID_VALUE"
 
     @pytest.mark.anyio
-    async def test_handle_value_error_logs_at_info_level(self) -> None:
+    async def test_handle_value_error_logs_at_info_level(
+        self, mock_request: Request, caplog: pytest.LogCaptureFixture
+    ) -> None:
         """ValueError is logged at info level."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         error = ValueError("Test error")
 
-        with patch("kavak_lite.entrypoints.http.exception_handlers.logger") as mock_logger:
+        with caplog.at_level(logging.INFO, logger=HANDLERS_LOGGER):
             await handle_value_error(mock_request, error)
 
-            mock_logger.info.assert_called_once()
-            call_args = mock_logger.info.call_args
-            assert "Value error" in call_args[0]
+        assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+            (logging.INFO, "Value error")
+        ]
 
 
 class TestHandleUnexpectedErrorDirectly:
     """Tests for handle_unexpected_error function directly."""
 
     @pytest.mark.anyio
-    async def test_handle_unexpected_error_returns_500(self) -> None:
+    async def test_handle_unexpected_error_returns_500(self, mock_request: Request) -> None:
         """handle_unexpected_error returns 500 status."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         error = RuntimeError("Unexpected error")
 
-        with patch("kavak_lite.entrypoints.http.exception_handlers.logger"):
-            response = await handle_unexpected_error(mock_request, error)
+        response = await handle_unexpected_error(mock_request, error)
 
         assert response.status_code == 500
 
     @pytest.mark.anyio
-    async def test_handle_unexpected_error_returns_generic_message(self) -> None:
+    async def test_handle_unexpected_error_returns_generic_message(
+        self, mock_request: Request
+    ) -> None:
         """Unexpected errors return generic message (no details leaked)."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         error = RuntimeError("Internal implementation detail")
 
-        with patch("kavak_lite.entrypoints.http.exception_handlers.logger"):
-            response = await handle_unexpected_error(mock_request, error)
+        response = await handle_unexpected_error(mock_request, error)
 
         import json
 
@@ -607,22 +572,21 @@ class TestHandleUnexpectedErrorDirectly:
         assert "Internal implementation detail" not in body["detail"]
 
     @pytest.mark.anyio
-    async def test_handle_unexpected_error_logs_with_traceback(self) -> None:
+    async def test_handle_unexpected_error_logs_with_traceback(
+        self, mock_request: Request, caplog: pytest.LogCaptureFixture
+    ) -> None:
         """Unexpected errors are logged with full traceback."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         error = RuntimeError("Test error")
 
-        with patch("kavak_lite.entrypoints.http.exception_handlers.logger") as mock_logger:
+        with caplog.at_level(logging.INFO, logger=HANDLERS_LOGGER):
             await handle_unexpected_error(mock_request, error)
 
-            # Verify error was logged with exc_info
-            mock_logger.error.assert_called_once()
-            call_args = mock_logger.error.call_args
-            assert "Unexpected error occurred" in call_args[0]
-            assert call_args[1]["exc_info"] == error
+        # Verify error was logged with exc_info
+        [record] = caplog.records
+        assert record.levelno == logging.ERROR
+        assert record.getMessage() == "Unexpected error occurred"
+        assert record.exc_info is not None
+        assert record.exc_info[1] is error
 
 
 class TestRegisterExceptionHandlers:
@@ -647,26 +611,23 @@ class TestRegisterExceptionHandlers:
             assert ValueError in exception_types
             assert Exception in exception_types
 
-    def test_register_exception_handlers_logs_success(self) -> None:
+    def test_register_exception_handlers_logs_success(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
         """register_exception_handlers logs successful registration."""
         app = FastAPI()
 
-        with patch("kavak_lite.entrypoints.http.exception_handlers.logger") as mock_logger:
+        with caplog.at_level(logging.INFO, logger=HANDLERS_LOGGER):
             register_exception_handlers(app)
 
-            mock_logger.info.assert_called_once_with("Exception handlers registered successfully")
-
-    def test_register_exception_handlers_actually_registers(self) -> None:
-        """Handlers registered by register_exception_handlers actually work."""
-        app = FastAPI()
-        register_exception_handlers(app)
+        assert caplog.messages == ["Exception handlers registered successfully"]
 
-        @app.get("/test")
-        def test_route() -> None:
-            raise ValidationError("Test error")
+    def test_register_exception_handlers_actually_registers(self, client: TestClient) -> None:
+        """Handlers registered by register_exception_handlers actually work.
 
-        client = TestClient(app, raise_server_exceptions=False)
-        response = client.get("/test")
+        The module's app is a bare FastAPI() set up only via register_exception_handlers.
+        """
+        response = client.get("/validation-error")
 
         # Verify the handler actually works
         assert response.status_code == 422
@@ -677,23 +638,32 @@ class TestLoggingBehavior:
     """Tests for logging behavior across different error types."""
 
     @pytest.mark.anyio
-    async def test_validation_errors_do_not_log_at_error_level(self) -> None:
+    async def test_validation_errors_do_not_log_at_error_level(
+        self, mock_request: Request, caplog: pytest.LogCaptureFixture
+    ) -> None:
         """Validation errors (expected) don't log at error level."""
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/test"
-        mock_request.method = "GET"
-
         error = ValidationError("Expected validation error")
 
-        with patch("kavak_lite.entrypoints.http.exception_handlers.logger") as mock_logger:
+        with caplog.at_level(logging.INFO, logger=HANDLERS_LOGGER):
             await handle_domain_error(mock_request, error)
 
-            # Should log at info, not error
-            mock_logger.error.assert_not_called()
-            mock_logger.info.assert_called_once()
+        # Should log at info, not error
+        assert [r.levelno for r in caplog.records] == [logging.INFO]
+
+    @pytest.mark.anyio
+    async def test_client_errors_skip_logging_when_info_disabled(
+        self, mock_request: Request, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Client errors don't build log records when INFO is filtered out."""
+        with caplog.at_level(logging.WARNING, logger=HANDLERS_LOGGER):
+            response = await handle_domain_error(mock_request, NotFoundError("Car", "123"))
+            await handle_value_error(mock_request, ValueError("Invalid format"))
+
+        assert caplog.records == []
+        assert response.status_code == 404
 
     @pytest.mark.anyio
-    async def test_internal_errors_log_context(self) -> None:
+    async def test_internal_errors_log_context(self, caplog: pytest.LogCaptureFixture) -> None:
         """Internal errors log full context for debugging."""
         mock_request = Mock(spec=Request)
         mock_request.url.path = "/api/cars"
@@ -701,13 +671,12 @@ class TestLoggingBehavior:
 
         error = InternalError("Database connection failed")
 
-        with patch("kavak_lite.entrypoints.http.exception_handlers.logger") as mock_logger:
+        with caplog.at_level(logging.INFO, logger=HANDLERS_LOGGER):
             await handle_domain_error(mock_request, error)
 
-            # Verify context was logged
-            call_kwargs = mock_logger.error.call_args[1]
-            extra = call_kwargs["extra"]
-
-            assert extra["path"] == "/api/cars"
-            assert extra["method"] == "POST"
-            assert extra["error_code"] == "INTERNAL_ERROR"
+        # Verify context was logged as record attributes
+        [record] = caplog.records
+        assert record.path == "/api/cars"
+        assert record.method == "POST"
+        assert record.error_code == "INTERNAL_ERROR"
+        assert record.error_message == "Database connection failed"
@@ -0,0 +1,26 @@
+"""Tests for the JSON response helper used by the route handlers."""
+
+import json
+
+from kavak_lite.entrypoints.http.dtos.catalog_search import CarResponseDTO
+from kavak_lite.entrypoints.http.responses import json_response
+
+
+def test_json_response_serializes_dto() -> None:
+    """The DTO is dumped to a JSON body with the JSON media type."""
+    dto = CarResponseDTO(id="1", brand="Toyota", model="Corolla", year=2020, price="25000.00")
+
+    response = json_response(dto)
+
+    assert response.status_code == 200
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == dto.model_dump(mode="json")
+
+
+def test_json_response_keeps_monetary_strings() -> None:
+    """Monetary strings are emitted verbatim (no float conversion)."""
+    dto = CarResponseDTO(id="1", brand="Toyota", model="Corolla", year=2020, price="25000.10")
+
+    response = json_response(dto)
+
+    assert b'"price":"25000.10"' in response.body
@@ -1,4 +1,4 @@
-from decimal import Decimal
+from decimal import ROUND_DOWN, Decimal, localcontext
 
 import pytest
 
@@ -257,22 +257,45 @@ def test_calculates_with_custom_interest_rate():
     assert plan.total_interest > Decimal("24000")  # Over $24k in interest
 
 
+def test_calculation_ignores_caller_decimal_context():
+    """A coarse thread-local decimal context must not leak into the plan."""
+    uc = CalculateFinancingPlan()
+    req = FinancingRequest(
+        price=Decimal("123456.78"), down_payment=Decimal("1000.00"), term_months=36
+    )
+
+    with localcontext(prec=4, rounding=ROUND_DOWN):
+        plan = uc.execute(req)
+
+    assert str(plan.principal) == "122456.78"
+    assert plan.monthly_payment == Decimal("3951.34")
+    assert plan.total_paid == Decimal("3951.34") * 36
+    assert plan.total_interest == plan.total_paid - Decimal("122456.78")
+
+
+def test_all_terms_ignore_caller_decimal_context():
+    """execute_all_terms computes the principal outside the caller's context too."""
+    uc = CalculateFinancingPlan()
+
+    with localcontext(prec=4, rounding=ROUND_DOWN):
+        plans = uc.execute_all_terms(price=Decimal("234567.89"), down_payment=Decimal("1000.00"))
+
+    assert {str(plan.principal) for plan in plans.values()} == {"233567.89"}
+
+
 def test_longer_term_means_lower_monthly_payment():
     """
     For the same principal, longer terms should have lower monthly payments.
     """
     uc = CalculateFinancingPlan()
-    req_36 = FinancingRequest(price=Decimal("100000"), down_payment=Decimal("0"), term_months=36)
-    req_72 = FinancingRequest(price=Decimal("100000"), down_payment=Decimal("0"), term_months=72)
 
-    plan_36 = uc.execute(req_36)
-    plan_72 = uc.execute(req_72)
+    plans = uc.execute_all_terms(price=Decimal("100000"), down_payment=Decimal("0"))
 
     # 72 months should have lower monthly payment than 36 months
-    assert plan_72.monthly_payment < plan_36.monthly_payment
+    assert plans[72].monthly_payment < plans[36].monthly_payment
 
     # But 72 months should have higher total interest
-    assert plan_72.total_interest > plan_36.total_interest
+    assert plans[72].total_interest > plans[36].total_interest
 
 
 def test_calculates_realistic_car_financing_scenario():
@@ -299,3 +322,53 @@ def test_calculates_realistic_car_financing_scenario():
 
     # Total interest over the life of the loan
     assert plan.total_interest == plan.total_paid - Decimal("200000")
+
+
+def test_all_terms_match_single_term_plans():
+    """The batched quote returns exactly what execute() returns for each term."""
+    uc = CalculateFinancingPlan()
+
+    plans = uc.execute_all_terms(price=Decimal("250000"), down_payment=Decimal("50000"))
+
+    assert list(plans) == [36, 48, 60, 72]
+    for term, plan in plans.items():
+        req = FinancingRequest(
+            price=Decimal("250000"), down_payment=Decimal("50000"), term_months=term
+        )
+        assert plan == uc.execute(req)
+
+
+def test_all_terms_validates_price_and_down_payment():
+    uc = CalculateFinancingPlan()
+
+    with pytest.raises(ValidationError):
+        uc.execute_all_terms(price=Decimal("100000"), down_payment=Decimal("100000"))
+
+
+# ============================================================================
+# MEMOIZATION TESTS
+# ============================================================================
+
+
+def test_repeated_quotes_share_one_plan():
+    """Identical quotes reuse the same (immutable) plan."""
+    uc = CalculateFinancingPlan()
+    req = FinancingRequest(price=Decimal("100000"), down_payment=Decimal("20000"), term_months=48)
+
+    assert uc.execute(req) is uc.execute(req)
+
+
+def test_memoized_plans_keep_input_representation():
+    """Equal amounts with different exponents are not served each other's plan."""
+    uc = CalculateFinancingPlan()
+
+    whole = uc.execute(
+        FinancingRequest(price=Decimal("100000"), down_payment=Decimal("20000"), term_months=72)
+    )
+    cents = uc.execute(
+        FinancingRequest(price=Decimal("100000.00"), down_payment=Decimal("20000"), term_months=72)
+    )
+
+    assert str(whole.principal) == "80000"
+    assert str(cents.principal) == "80000.00"
+    assert whole.monthly_payment == cents.monthly_payment
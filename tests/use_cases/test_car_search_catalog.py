@@ -222,6 +222,21 @@ def test_execute_rejects_limit_exceeding_max(mock_repository: Mock) -> None:
     mock_repository.search.assert_not_called()
 
 
+def test_execute_rejects_unknown_count_mode(mock_repository: Mock) -> None:
+    """UseCase validates count_mode is a supported value."""
+    use_case = SearchCarCatalog(mock_repository)
+
+    request = SearchCarCatalogRequest(
+        filters=CatalogFilters(),
+        paging=Paging(offset=0, limit=20, count_mode="estimated"),  # type: ignore[arg-type]
+    )
+
+    with pytest.raises(ValidationError):
+        use_case.execute(request)
+
+    mock_repository.search.assert_not_called()
+
+
 # ==============================================================================
 # Validation - Filter Errors
 # ==============================================================================
@@ -299,6 +314,25 @@ def test_execute_rejects_float_for_price_max(mock_repository: Mock) -> None:
     mock_repository.search.assert_not_called()
 
 
+def test_execute_reports_type_error_for_uncomparable_price_bound(mock_repository: Mock) -> None:
+    """A non-Decimal bound is reported as INVALID_TYPE, not compared to the other bound."""
+    use_case = SearchCarCatalog(mock_repository)
+
+    request = SearchCarCatalogRequest(
+        filters=CatalogFilters(
+            price_min="250000",  # type: ignore - Intentionally wrong type for test
+            price_max=Decimal("400000"),
+        ),
+        paging=Paging(offset=0, limit=20),
+    )
+
+    with pytest.raises(ValidationError) as exc_info:
+        use_case.execute(request)
+
+    assert [error["code"] for error in exc_info.value.errors] == ["INVALID_TYPE"]
+    mock_repository.search.assert_not_called()
+
+
 # ==============================================================================
 # Validation - Multiple Errors
 # ==============================================================================
@@ -388,9 +422,12 @@ def test_execute_response_is_immutable(mock_repository: Mock, sample_cars: list[
 # ==============================================================================
 
 
-def test_execute_returns_total_count(mock_repository: Mock, sample_cars: list[Car]) -> None:
-    """UseCase returns total_count from repository in response."""
-    mock_repository.search.return_value = SearchResult(cars=sample_cars, total_count=10)
+@pytest.mark.parametrize("total_count", [5, 10, 100])
+def test_execute_returns_total_count(
+    mock_repository: Mock, sample_cars: list[Car], total_count: int
+) -> None:
+    """Response carries the page of cars plus the repository's pre-paging total_count."""
+    mock_repository.search.return_value = SearchResult(cars=sample_cars, total_count=total_count)
     use_case = SearchCarCatalog(mock_repository)
 
     request = SearchCarCatalogRequest(
@@ -400,28 +437,8 @@ def test_execute_returns_total_count(mock_repository: Mock, sample_cars: list[Ca
 
     response = use_case.execute(request)
 
-    assert response.total_count == 10  # From repository
-    assert len(response.cars) == 2  # Paginated
-
-
-def test_execute_total_count_reflects_pre_paging_total(mock_repository: Mock) -> None:
-    """total_count shows total matches before paging."""
-    # Simulate: 5 total matches, but only 2 in this page
-    paginated_cars = [
-        Car(id="1", make="Toyota", model="Corolla", year=2020, price=Decimal("250000.00")),
-        Car(id="2", make="Toyota", model="Camry", year=2021, price=Decimal("300000.00")),
-    ]
-    mock_repository.search.return_value = SearchResult(cars=paginated_cars, total_count=5)
-    use_case = SearchCarCatalog(mock_repository)
-
-    request = SearchCarCatalogRequest(
-        filters=CatalogFilters(make="Toyota"),
-        paging=Paging(offset=0, limit=2),
-    )
-
-    response = use_case.execute(request)
-
-    assert response.total_count == 5  # Total Toyotas
+    assert response.total_count == total_count  # Total matches, from repository
+    assert response.cars == sample_cars  # Only the current page
     assert len(response.cars) == 2  # Page size
 
 
@@ -455,22 +472,3 @@ def test_execute_total_count_zero_for_no_matches(mock_repository: Mock) -> None:
 
     assert response.total_count == 0
     assert response.cars == []
-
-
-def test_execute_response_includes_metadata(mock_repository: Mock, sample_cars: list[Car]) -> None:
-    """Response structure includes both cars and total_count metadata."""
-    mock_repository.search.return_value = SearchResult(cars=sample_cars, total_count=100)
-    use_case = SearchCarCatalog(mock_repository)
-
-    request = SearchCarCatalogRequest(
-        filters=CatalogFilters(),
-        paging=Paging(offset=0, limit=20),
-    )
-
-    response = use_case.execute(request)
-
-    # Verify response has both fields
-    assert hasattr(response, "cars")
-    assert hasattr(response, "total_count")
-    assert response.cars == sample_cars
-    assert response.total_count == 100
@@ -23,9 +23,9 @@ def mock_repository() -> Mock:
     return Mock(spec=CarCatalogRepository)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def sample_car() -> Car:
-    """Sample car entity for testing."""
+    """Sample car entity for testing (frozen, so shared across the module)."""
     return Car(
         id="550e8400-e29b-41d4-a716-446655440000",
         make="Toyota",
@@ -134,22 +134,23 @@ def test_execute_rejects_empty_string(mock_repository: Mock) -> None:
     assert exc_info.value.errors[0]["field"] == "car_id"
 
 
-def test_execute_rejects_invalid_uuid_formats(mock_repository: Mock) -> None:
+@pytest.mark.parametrize(
+    "invalid_uuid",
+    [
+        pytest.param("123", id="too_short_digits"),
+        pytest.param("not-a-uuid", id="words"),
+        pytest.param("550e8400-e29b-41d4-a716", id="truncated"),
+        pytest.param("550e8400-e29b-41d4-a716-446655440000-extra", id="trailing_extra"),
+        pytest.param("ZZZZZZZZ-ZZZZ-ZZZZ-ZZZZ-ZZZZZZZZZZZZ", id="non_hex"),
+    ],
+)
+def test_execute_rejects_invalid_uuid_formats(mock_repository: Mock, invalid_uuid: str) -> None:
     """Use case rejects various invalid UUID formats."""
     use_case = GetCarById(car_catalog_repository=mock_repository)
 
-    invalid_uuids = [
-        "123",
-        "not-a-uuid",
-        "550e8400-e29b-41d4-a716",  # Too short
-        "550e8400-e29b-41d4-a716-446655440000-extra",  # Too long
-        "ZZZZZZZZ-ZZZZ-ZZZZ-ZZZZ-ZZZZZZZZZZZZ",  # Invalid characters
-    ]
-
-    for invalid_uuid in invalid_uuids:
-        request = GetCarByIdRequest(car_id=invalid_uuid)
-        with pytest.raises(ValidationError):
-            use_case.execute(request)
+    request = GetCarByIdRequest(car_id=invalid_uuid)
+    with pytest.raises(ValidationError):
+        use_case.execute(request)
 
 
 def test_execute_does_not_call_repository_for_invalid_uuid(mock_repository: Mock) -> None:
@@ -170,21 +171,26 @@ def test_execute_does_not_call_repository_for_invalid_uuid(mock_repository: Mock
 # ==============================================================================
 
 
-def test_execute_accepts_valid_uuid_formats(mock_repository: Mock, sample_car: Car) -> None:
+@pytest.mark.parametrize(
+    "valid_uuid",
+    [
+        pytest.param("550e8400-e29b-41d4-a716-446655440000", id="standard"),
+        pytest.param("550E8400-E29B-41D4-A716-446655440000", id="uppercase"),
+        pytest.param("550e8400e29b41d4a716446655440000", id="no_hyphens"),
+        # Not matched by the fast-path regex; accepted via uuid.UUID
+        pytest.param("{550e8400-e29b-41d4-a716-446655440000}", id="braces"),
+    ],
+)
+def test_execute_accepts_valid_uuid_formats(
+    mock_repository: Mock, sample_car: Car, valid_uuid: str
+) -> None:
     """Use case accepts various valid UUID formats."""
     mock_repository.get_by_id.return_value = sample_car
     use_case = GetCarById(car_catalog_repository=mock_repository)
 
-    valid_uuids = [
-        "550e8400-e29b-41d4-a716-446655440000",  # Standard format
-        "550E8400-E29B-41D4-A716-446655440000",  # Uppercase
-        "550e8400e29b41d4a716446655440000",  # No hyphens
-    ]
-
-    for valid_uuid in valid_uuids:
-        request = GetCarByIdRequest(car_id=valid_uuid)
-        result = use_case.execute(request)
-        assert isinstance(result, GetCarByIdResponse)
+    request = GetCarByIdRequest(car_id=valid_uuid)
+    result = use_case.execute(request)
+    assert isinstance(result, GetCarByIdResponse)
 
 
 # ==============================================================================